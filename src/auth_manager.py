@@ -6,8 +6,14 @@ QA Sync 인증 관리자
 - 로그인 플로우 지원
 """
 
+import functools
 import json
+import logging
 import os
+import platform
+import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict
@@ -19,34 +25,90 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson이 있으면 목록 요약을 스트리밍으로 읽음 (큰 storage_state 대비)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 # 인증 데이터 저장 경로
 AUTH_DIR = Path.home() / ".qa-sync" / "auth"
+_auth_dir_ready = False
+
+# list_saved_auth 결과 캐시: (목록, 조회 시각). 저장/삭제 시 무효화
+AUTH_LIST_TTL = 2.0
+_auth_cache = None
+
+
+def _dumps(data: Dict) -> bytes:
+    """JSON 직렬화 (compact, UTF-8 bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict:
+    """JSON 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def get_auth_path(site_name: str) -> Path:
     """사이트별 인증 데이터 경로"""
-    AUTH_DIR.mkdir(parents=True, exist_ok=True)
+    global _auth_dir_ready
+    if not _auth_dir_ready:
+        AUTH_DIR.mkdir(parents=True, exist_ok=True)
+        _auth_dir_ready = True
     return AUTH_DIR / f"{site_name}.json"
 
 
-def save_cookies(site_name: str, cookies: List[Dict]) -> Path:
-    """쿠키 저장"""
+def get_storage_state_path(site_name: str) -> Optional[Path]:
+    """
+    저장된 storage_state 파일 경로 (없으면 None)
+
+    browser.new_context(storage_state=...)에 그대로 전달 가능
+    (site_name/saved_at 같은 메타 필드는 Playwright가 무시)
+    """
+    auth_path = get_auth_path(site_name)
+    return auth_path if auth_path.exists() else None
+
+
+def save_storage_state(site_name: str, storage_state: Dict) -> Path:
+    """storage_state 저장 (쿠키 + origin별 localStorage)"""
     auth_path = get_auth_path(site_name)
 
     data = {
         "site_name": site_name,
         "saved_at": datetime.now().isoformat(),
-        "cookies": cookies
+        "cookies": storage_state.get("cookies", []),
+        "origins": storage_state.get("origins", [])
     }
 
-    with open(auth_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(auth_path, "wb") as f:
+        f.write(_dumps(data))
+    _invalidate_auth_cache()
 
-    print(f"✅ 쿠키 저장됨: {auth_path}")
+    logger.info("✅ 인증 상태 저장됨: %s", auth_path)
     return auth_path
 
 
+def save_cookies(site_name: str, cookies: List[Dict]) -> Path:
+    """쿠키만 저장 (storage_state 형식, origins 없음)"""
+    return save_storage_state(site_name, {"cookies": cookies})
+
+
 def load_cookies(site_name: str) -> Optional[List[Dict]]:
     """쿠키 로드"""
     auth_path = get_auth_path(site_name)
@@ -55,11 +117,11 @@ def load_cookies(site_name: str) -> Optional[List[Dict]]:
         return None
 
     try:
-        with open(auth_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(auth_path, "rb") as f:
+            data = _loads(f.read())
             return data.get("cookies", [])
     except Exception as e:
-        print(f"⚠️ 쿠키 로드 실패: {e}")
+        logger.warning("⚠️ 쿠키 로드 실패: %s", e)
         return None
 
 
@@ -69,27 +131,115 @@ def delete_cookies(site_name: str) -> bool:
 
     if auth_path.exists():
         auth_path.unlink()
-        print(f"✅ 쿠키 삭제됨: {site_name}")
+        _invalidate_auth_cache()
+        logger.info("✅ 쿠키 삭제됨: %s", site_name)
         return True
     return False
 
 
+def _invalidate_auth_cache() -> None:
+    global _auth_cache
+    _auth_cache = None
+
+
 def list_saved_auth() -> List[str]:
-    """저장된 인증 목록"""
+    """저장된 인증 목록 (AUTH_LIST_TTL초 동안 캐시)"""
+    global _auth_cache
+    if _auth_cache and time.monotonic() - _auth_cache[1] < AUTH_LIST_TTL:
+        return list(_auth_cache[0])
+
     if not AUTH_DIR.exists():
         return []
 
-    return [f.stem for f in AUTH_DIR.glob("*.json")]
+    sites = [f.stem for f in AUTH_DIR.glob("*.json")]
+    _auth_cache = (sites, time.monotonic())
+    return list(sites)
 
 
-def export_cookies_from_browser(url: str, site_name: str) -> Optional[Path]:
+def read_auth_summary(auth_path: Path) -> tuple:
+    """
+    목록 표시용 요약 (saved_at, 쿠키 수)
+
+    ijson이 있으면 파일 전체를 dict로 만들지 않고 스트리밍으로 셈
+    """
+    with open(auth_path, "rb") as f:
+        if IJSON_AVAILABLE:
+            saved_at = ""
+            cookie_count = 0
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "saved_at":
+                    saved_at = value
+                elif prefix == "cookies.item" and event == "start_map":
+                    cookie_count += 1
+                elif prefix == "cookies" and event == "end_array" and saved_at:
+                    break  # 나머지(origins)는 볼 필요 없음
+            return saved_at, cookie_count
+
+        data = _loads(f.read())
+    return data.get("saved_at", ""), len(data.get("cookies", []))
+
+
+def _wait_for_login(page, success_url_pattern: Optional[str], success_selector: Optional[str], timeout: int) -> bool:
+    """
+    로그인 완료 감지 또는 Enter 입력 중 먼저 오는 쪽까지 대기
+
+    Returns:
+        True면 저장 진행, False면 취소/타임아웃
+    """
+    enter_pressed = threading.Event()
+
+    def wait_enter():
+        try:
+            input("✋ Enter를 눌러 쿠키 저장 (로그인 감지 시 자동 저장)... ")
+        except (EOFError, KeyboardInterrupt):
+            return  # 비대화형 환경: 자동 감지에만 의존
+        enter_pressed.set()
+
+    threading.Thread(target=wait_enter, daemon=True).start()
+    deadline = time.monotonic() + timeout
+
+    try:
+        while not enter_pressed.is_set():
+            if success_url_pattern and re.search(success_url_pattern, page.url):
+                print(f"\n🔓 로그인 감지 (URL): {page.url}")
+                return True
+            if success_selector:
+                try:
+                    if page.query_selector(success_selector):
+                        print(f"\n🔓 로그인 감지 (요소): {success_selector}")
+                        return True
+                except Exception:
+                    pass  # 페이지 이동 중에는 쿼리 실패 가능
+            if time.monotonic() > deadline:
+                print(f"\n❌ {timeout}초 안에 로그인이 감지되지 않았습니다.")
+                return False
+            page.wait_for_timeout(500)
+    except KeyboardInterrupt:
+        print("\n취소됨")
+        return False
+
+    return True
+
+
+def export_cookies_from_browser(
+    url: str,
+    site_name: str,
+    success_url_pattern: Optional[str] = None,
+    success_selector: Optional[str] = None,
+    timeout: int = 300
+) -> Optional[Path]:
     """
     브라우저를 열어 수동 로그인 후 쿠키 저장
 
     1. 브라우저 창이 열림
     2. 사용자가 직접 로그인
-    3. 로그인 완료 후 Enter 입력
+    3. 로그인 완료 후 Enter 입력 (또는 완료 조건 자동 감지)
     4. 쿠키 자동 저장
+
+    Args:
+        success_url_pattern: 로그인 후 URL 정규식 (예: "/dashboard")
+        success_selector: 로그인 후에만 보이는 요소 선택자
+        timeout: 자동 감지 최대 대기 시간 (초)
     """
     if not PLAYWRIGHT_AVAILABLE:
         print("❌ Playwright가 설치되지 않았습니다.")
@@ -117,29 +267,40 @@ def export_cookies_from_browser(url: str, site_name: str) -> Optional[Path]:
 
     print(f"\n" + "="*50)
     print(f"   브라우저에서 로그인을 완료하세요.")
-    print(f"   완료 후 이 터미널에서 Enter를 눌러주세요.")
+    if success_url_pattern or success_selector:
+        print(f"   로그인이 감지되면 자동 저장됩니다. (Enter로 즉시 저장)")
+    else:
+        print(f"   완료 후 이 터미널에서 Enter를 눌러주세요.")
     print(f"="*50 + "\n")
 
-    # 사용자 입력 대기 (별도 처리)
-    try:
-        input("✋ Enter를 눌러 쿠키 저장... ")
-    except EOFError:
-        print("❌ 대화형 터미널이 필요합니다.")
-        print("   직접 터미널에서 실행해주세요.")
-        browser.close()
-        p.stop()
-        return None
-    except KeyboardInterrupt:
-        print("\n취소됨")
-        browser.close()
-        p.stop()
-        return None
-
-    # 쿠키 추출
-    cookies = context.cookies()
+    if success_url_pattern or success_selector:
+        # 로그인 자동 감지 (Enter도 함께 대기)
+        if not _wait_for_login(page, success_url_pattern, success_selector, timeout):
+            browser.close()
+            p.stop()
+            return None
+    else:
+        # 사용자 입력 대기 (별도 처리)
+        try:
+            input("✋ Enter를 눌러 쿠키 저장... ")
+        except EOFError:
+            print("❌ 대화형 터미널이 필요합니다.")
+            print("   직접 터미널에서 실행하거나 --success-url/--success-selector를 지정해주세요.")
+            browser.close()
+            p.stop()
+            return None
+        except KeyboardInterrupt:
+            print("\n취소됨")
+            browser.close()
+            p.stop()
+            return None
+
+    # 쿠키 + localStorage 추출
+    storage_state = context.storage_state()
+    cookies = storage_state.get("cookies", [])
 
     # 저장
-    auth_path = save_cookies(site_name, cookies)
+    auth_path = save_storage_state(site_name, storage_state)
 
     # 정리
     browser.close()
@@ -160,7 +321,7 @@ async def apply_cookies_async(context: BrowserContext, site_name: str) -> bool:
         await context.add_cookies(cookies)
         return True
     except Exception as e:
-        print(f"⚠️ 쿠키 적용 실패: {e}")
+        logger.warning("⚠️ 쿠키 적용 실패: %s", e)
         return False
 
 
@@ -175,14 +336,13 @@ def apply_cookies_sync(context, site_name: str) -> bool:
         context.add_cookies(cookies)
         return True
     except Exception as e:
-        print(f"⚠️ 쿠키 적용 실패: {e}")
+        logger.warning("⚠️ 쿠키 적용 실패: %s", e)
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_chrome_user_data_dir() -> Optional[Path]:
-    """Chrome 기본 프로필 경로"""
-    import platform
-
+    """Chrome 기본 프로필 경로 (프로세스당 한 번만 조회)"""
     system = platform.system()
 
     if system == "Darwin":  # macOS
@@ -206,19 +366,17 @@ def use_chrome_profile(profile_name: str = "Default") -> Optional[Dict]:
     user_data_dir = get_chrome_user_data_dir()
 
     if not user_data_dir:
-        print("❌ Chrome 프로필을 찾을 수 없습니다.")
+        logger.error("❌ Chrome 프로필을 찾을 수 없습니다.")
         return None
 
     profile_path = user_data_dir / profile_name
 
     if not profile_path.exists():
-        print(f"❌ 프로필 '{profile_name}'을 찾을 수 없습니다.")
-        print(f"   경로: {profile_path}")
+        logger.error("❌ 프로필 '%s'을 찾을 수 없습니다. (경로: %s)", profile_name, profile_path)
         return None
 
-    print(f"✅ Chrome 프로필 발견: {profile_name}")
-    print(f"   경로: {user_data_dir}")
-    print(f"\n⚠️  주의: Chrome을 먼저 종료해야 합니다!")
+    logger.info("✅ Chrome 프로필 발견: %s (경로: %s)", profile_name, user_data_dir)
+    logger.warning("⚠️  주의: Chrome을 먼저 종료해야 합니다!")
 
     return {
         "user_data_dir": str(user_data_dir),
@@ -226,12 +384,13 @@ def use_chrome_profile(profile_name: str = "Default") -> Optional[Dict]:
     }
 
 
-def list_chrome_profiles() -> List[str]:
-    """Chrome 프로필 목록"""
+@functools.lru_cache(maxsize=1)
+def _scan_chrome_profiles() -> tuple:
+    """Chrome 프로필 디렉터리 스캔 (프로세스당 한 번)"""
     user_data_dir = get_chrome_user_data_dir()
 
     if not user_data_dir:
-        return []
+        return ()
 
     profiles = ["Default"]
 
@@ -240,24 +399,33 @@ def list_chrome_profiles() -> List[str]:
         if item.is_dir() and item.name.startswith("Profile "):
             profiles.append(item.name)
 
-    return profiles
+    return tuple(profiles)
+
+
+def list_chrome_profiles() -> List[str]:
+    """Chrome 프로필 목록"""
+    return list(_scan_chrome_profiles())
 
 
 # CLI 인터페이스
 if __name__ == "__main__":
     import sys
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if len(sys.argv) < 2:
         print("Usage: auth_manager.py <command> [args]")
         print("")
         print("Commands:")
         print("  login <url> <site_name>  - 브라우저 로그인 후 쿠키 저장")
+        print("        [--success-url <regex>] [--success-selector <css>]  - 로그인 자동 감지")
         print("  list                     - 저장된 인증 목록")
         print("  delete <site_name>       - 저장된 인증 삭제")
         print("  profiles                 - Chrome 프로필 목록")
         print("")
         print("Examples:")
         print("  python3 auth_manager.py login https://valley.town valley")
+        print("  python3 auth_manager.py login https://valley.town valley --success-url /dashboard")
         print("  python3 auth_manager.py list")
         sys.exit(1)
 
@@ -266,19 +434,23 @@ if __name__ == "__main__":
     if cmd == "login" and len(sys.argv) > 3:
         url = sys.argv[2]
         site_name = sys.argv[3]
-        export_cookies_from_browser(url, site_name)
+        options = dict(zip(sys.argv[4::2], sys.argv[5::2]))
+        export_cookies_from_browser(
+            url,
+            site_name,
+            success_url_pattern=options.get("--success-url"),
+            success_selector=options.get("--success-selector")
+        )
 
     elif cmd == "list":
-        sites = list_saved_auth()
-        if sites:
+        # 디렉터리를 한 번만 훑으면서 각 파일을 바로 읽음
+        auth_files = sorted(AUTH_DIR.glob("*.json")) if AUTH_DIR.exists() else []
+        if auth_files:
             print("저장된 인증:")
-            for site in sites:
-                auth_path = get_auth_path(site)
-                with open(auth_path) as f:
-                    data = json.load(f)
-                    saved_at = data.get("saved_at", "")[:19]
-                    cookie_count = len(data.get("cookies", []))
-                print(f"  - {site} ({cookie_count}개 쿠키, {saved_at})")
+            for auth_path in auth_files:
+                saved_at, cookie_count = read_auth_summary(auth_path)
+                saved_at = saved_at[:19]
+                print(f"  - {auth_path.stem} ({cookie_count}개 쿠키, {saved_at})")
         else:
             print("저장된 인증 없음")
 
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+QA Sync Crawler Worker
+- Redis 큐 기반 크롤링 작업 분산 (여러 프로세스/머신에서 워커 실행)
+- 작업 등록 → 워커가 BLPOP으로 가져와 crawl_site 실행 → 결과 키에 저장
+- 선택 의존성: pip install redis
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import uuid
+from pathlib import Path
+from typing import Optional
+
+# Redis 클라이언트 (선택)
+try:
+    import redis
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).parent))
+from site_crawler import SiteCrawler, crawl_site, run_async
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REDIS_URL = os.environ.get("QA_SYNC_REDIS_URL", "redis://localhost:6379/0")
+JOB_QUEUE = "qa:crawl:jobs"
+RESULT_KEY = "qa:crawl:results:{job_id}"
+RESULT_TTL = 3600  # 결과 보관 시간 (초)
+
+
+def _require_redis():
+    if not REDIS_AVAILABLE:
+        raise RuntimeError("redis not installed. Run: pip install redis")
+
+
+def enqueue_crawl(
+    url: str,
+    screenshot_dir: Optional[str] = None,
+    auth_site: Optional[str] = None,
+    redis_url: str = DEFAULT_REDIS_URL
+) -> str:
+    """
+    크롤링 작업 등록
+
+    Returns:
+        작업 ID (wait_result로 결과 조회)
+    """
+    _require_redis()
+
+    job_id = uuid.uuid4().hex
+    job = {"id": job_id, "url": url, "screenshot_dir": screenshot_dir, "auth_site": auth_site}
+    redis.Redis.from_url(redis_url).rpush(JOB_QUEUE, json.dumps(job))
+    return job_id
+
+
+def wait_result(job_id: str, timeout: int = 120, redis_url: str = DEFAULT_REDIS_URL) -> Optional[dict]:
+    """작업 결과 대기 (timeout 초 안에 없으면 None)"""
+    _require_redis()
+
+    item = redis.Redis.from_url(redis_url).blpop(RESULT_KEY.format(job_id=job_id), timeout=timeout)
+    if not item:
+        return None
+    return json.loads(item[1])
+
+
+async def _write_result(client, job_id: str, result: dict) -> None:
+    """작업 결과 저장 (wait_result가 BLPOP으로 가져감)"""
+    key = RESULT_KEY.format(job_id=job_id)
+    await client.rpush(key, json.dumps(result, ensure_ascii=False))
+    await client.expire(key, RESULT_TTL)
+
+
+async def _parse_job(client, payload: bytes) -> Optional[dict]:
+    """큐 페이로드 → 작업 (잘못된 작업은 건너뛰고, id가 있으면 에러 결과 저장)"""
+    try:
+        job = json.loads(payload)
+    except ValueError as e:
+        logger.error("❌ Malformed job payload skipped: %s", e)
+        return None
+
+    if not isinstance(job, dict) or not job.get("id"):
+        logger.error("❌ Job without id skipped: %r", job)
+        return None
+
+    if not isinstance(job.get("url"), str) or not job["url"]:
+        logger.error("❌ Job %s has no url", job["id"])
+        await _write_result(client, str(job["id"]), {"error": "job has no url"})
+        return None
+
+    return job
+
+
+async def _run_job(client, job: dict) -> None:
+    """작업 하나 실행 후 결과 저장 (실패 시 error 필드)"""
+    try:
+        # 같은 인증을 쓰는 작업이 이어질 수 있으므로 쿠키는 지우지 않음
+        result = await crawl_site(job["url"], job.get("screenshot_dir"), job.get("auth_site"), cleanup_auth=False)
+        logger.info("✅ %s", job["url"])
+    except Exception as e:
+        result = {"error": str(e)}
+        logger.error("❌ %s: %s", job["url"], e)
+
+    await _write_result(client, str(job["id"]), result)
+
+
+async def run_worker(redis_url: str = DEFAULT_REDIS_URL, concurrency: int = 4) -> None:
+    """
+    워커 실행 (큐에서 작업을 가져와 최대 concurrency개 동시 처리)
+
+    Args:
+        redis_url: Redis 접속 URL
+        concurrency: 워커 하나가 동시에 처리할 작업 수
+    """
+    _require_redis()
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1 (got {concurrency})")
+
+    client = aioredis.Redis.from_url(redis_url)
+    sem = asyncio.Semaphore(concurrency)
+    tasks = set()
+
+    async def run_one(job: dict):
+        try:
+            await _run_job(client, job)
+        finally:
+            sem.release()
+
+    logger.info("🔧 Crawler worker started (queue: %s, concurrency: %d)", JOB_QUEUE, concurrency)
+
+    try:
+        while True:
+            # 빈 슬롯이 생길 때만 작업을 가져옴 (다른 워커가 가져갈 수 있도록)
+            await sem.acquire()
+            _, payload = await client.blpop(JOB_QUEUE)
+
+            job = await _parse_job(client, payload)
+            if job is None:
+                sem.release()
+                continue
+
+            task = asyncio.create_task(run_one(job))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    finally:
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await SiteCrawler.shutdown()
+        await client.aclose()
+
+
+# CLI 인터페이스
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    parser = argparse.ArgumentParser(description="QA Sync Crawler Worker")
+    parser.add_argument("--redis", default=DEFAULT_REDIS_URL, help="Redis 접속 URL (기본: $QA_SYNC_REDIS_URL)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    worker_parser = sub.add_parser("worker", help="워커 실행")
+    worker_parser.add_argument("--concurrency", "-c", type=int, default=4, help="동시 처리 작업 수 (기본: 4)")
+
+    enqueue_parser = sub.add_parser("enqueue", help="크롤링 작업 등록")
+    enqueue_parser.add_argument("url", help="크롤링할 URL")
+    enqueue_parser.add_argument("screenshot_dir", nargs="?", help="스크린샷 저장 경로")
+    enqueue_parser.add_argument("--auth", "-a", help="인증에 사용할 사이트 이름")
+    enqueue_parser.add_argument("--wait", "-w", type=int, metavar="SECONDS", help="결과를 기다렸다가 출력")
+
+    args = parser.parse_args()
+
+    if args.command == "worker" and args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+
+    try:
+        if args.command == "worker":
+            try:
+                run_async(run_worker(args.redis, args.concurrency))
+            except KeyboardInterrupt:
+                print("\n👋 Worker stopped")
+
+        elif args.command == "enqueue":
+            job_id = enqueue_crawl(args.url, args.screenshot_dir, args.auth, args.redis)
+            print(f"Job queued: {job_id}")
+
+            if args.wait:
+                result = wait_result(job_id, args.wait, args.redis)
+                if result is None:
+                    print("⏱️ Timed out waiting for result")
+                    sys.exit(1)
+                if "error" in result:
+                    print(f"❌ {result['error']}")
+                    sys.exit(1)
+                print(result["markdown"])
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
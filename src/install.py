@@ -16,6 +16,8 @@ from pathlib import Path
 QA_SYNC_HOME = Path.home() / ".qa-sync"
 VENV_PATH = QA_SYNC_HOME / "venv"
 REQUIREMENTS = ["playwright>=1.40.0"]
+# 선택 패키지 (정적 HTML 페이지를 브라우저 없이 분석, 설치 실패해도 계속 진행)
+OPTIONAL_REQUIREMENTS = ["httpx", "selectolax"]
 
 
 def print_step(msg: str):
@@ -83,33 +85,57 @@ def install_packages():
     except:
         pass
 
-    # 패키지 설치
-    for package in REQUIREMENTS:
-        print(f"📦 Installing {package}...")
-        try:
-            subprocess.run([str(pip), "install", package], check=True)
-            print(f"✅ {package} 설치 완료")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ {package} 설치 실패: {e}")
-            return False
+    # 필수 패키지 설치 (한 번의 pip 실행으로 의존성 해석도 한 번만)
+    packages = ", ".join(REQUIREMENTS)
+    print(f"📦 Installing {packages}...")
+    try:
+        subprocess.run([str(pip), "install", *REQUIREMENTS], check=True)
+        print(f"✅ {packages} 설치 완료")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ 패키지 설치 실패: {e}")
+        return False
 
     return True
 
 
-def install_playwright_browsers():
-    """Playwright 브라우저 설치"""
+def install_optional_packages():
+    """선택 패키지 설치 (브라우저 다운로드와 동시에 진행, 실패해도 계속)"""
+    pip = get_pip()
+
+    packages = ", ".join(OPTIONAL_REQUIREMENTS)
+    print(f"📦 Installing optional {packages}...")
+    try:
+        subprocess.run([str(pip), "install", *OPTIONAL_REQUIREMENTS], check=True)
+        print(f"✅ {packages} 설치 완료")
+    except subprocess.CalledProcessError as e:
+        print(f"⚠️  선택 패키지 설치 실패 (정적 페이지도 브라우저로 분석): {e}")
+
+
+def start_playwright_browser_install():
+    """Playwright 브라우저 설치 시작 (백그라운드, 다운로드 중 다른 단계 진행)"""
     print_step("3. Playwright 브라우저 설치")
 
+    if os.environ.get("PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD"):
+        print("⏭️  PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD 설정됨 - 브라우저 설치 건너뜀")
+        return None
+
     python = get_python()
+    return subprocess.Popen([str(python), "-m", "playwright", "install", "chromium"])
 
-    try:
-        subprocess.run([str(python), "-m", "playwright", "install", "chromium"], check=True)
-        print("✅ Chromium 브라우저 설치 완료")
+
+def wait_playwright_browser_install(process) -> bool:
+    """백그라운드 브라우저 설치 완료 대기"""
+    if process is None:
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ 브라우저 설치 실패: {e}")
+
+    returncode = process.wait()
+    if returncode != 0:
+        print(f"❌ 브라우저 설치 실패 (exit code {returncode})")
         return False
 
+    print("✅ Chromium 브라우저 설치 완료")
+    return True
+
 
 def create_wrapper_script():
     """실행 래퍼 스크립트 생성"""
@@ -248,11 +274,15 @@ def main():
     if not install_packages():
         sys.exit(1)
 
-    if not install_playwright_browsers():
-        sys.exit(1)
+    # 브라우저 다운로드(수십 초)를 먼저 시작하고, 그동안 선택 패키지 설치/래퍼 스크립트 생성
+    browser_install = start_playwright_browser_install()
 
+    install_optional_packages()
     scripts_dir = create_wrapper_script()
 
+    if not wait_playwright_browser_install(browser_install):
+        sys.exit(1)
+
     if not check_installation():
         print("\n⚠️  설치는 완료되었으나 확인 실패. 수동 확인 필요.")
 
@@ -9,27 +9,238 @@ QA Sync Site Crawler
 
 import json
 import asyncio
+import logging
+import re
 import sys
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
+logger = logging.getLogger(__name__)
+
 try:
     from playwright.async_api import async_playwright, Page, Browser
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
-    print("Warning: playwright not installed. Run: python3 src/install.py")
+    logger.warning("Warning: playwright not installed. Run: python3 src/install.py")
 
 # 인증 관리자 임포트
 sys.path.insert(0, str(Path(__file__).parent))
 try:
-    from auth_manager import load_cookies, apply_cookies_async, export_cookies_from_browser
+    from auth_manager import get_storage_state_path, export_cookies_from_browser
     AUTH_AVAILABLE = True
 except ImportError:
     AUTH_AVAILABLE = False
 
+# 정적 HTML 빠른 경로 (선택: pip install httpx selectolax)
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
+    STATIC_AVAILABLE = True
+except ImportError:
+    STATIC_AVAILABLE = False
+
+# uvloop이 있으면 동기 래퍼/CLI의 이벤트 루프로 사용 (선택: pip install uvloop)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# orjson이 있으면 분석 JSON 저장에 사용 (없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 이보다 작거나 버튼이 적으면 클라이언트 렌더링 셸로 보고 브라우저로 분석
+STATIC_MIN_HTML_BYTES = 2048
+STATIC_MIN_BUTTONS = 3
+
+# 절대 URL에서 호스트(netloc) 끝 위치
+_HOST_END_RE = re.compile(r"[/?#]")
+
+# 요소 추출에 필요 없는 리소스 (스크린샷을 찍을 때는 화면에 영향 적은 것만 차단)
+# stylesheet는 차단하지 않음 (CSS로 숨긴 모달의 visible 판단이 달라짐)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_RESOURCE_TYPES_WITH_SCREENSHOT = frozenset({"media", "font"})
+
+
+# 추출 대상 선택자 (JS 추출 스크립트와 정적 경로가 공유)
+_BUTTON_SELECTOR = "button"
+_ROLE_BUTTON_SELECTOR = "[role='button']"
+_INPUT_BUTTON_SELECTOR = "input[type='submit'], input[type='button']"
+_LINK_SELECTOR = "a[href]"
+_FIELD_SELECTOR = "input, select, textarea"
+_MODAL_SELECTORS = (
+    "[role='dialog']",
+    "[role='alertdialog']",
+    ".modal",
+    ".dialog",
+    "[class*='modal']",
+    "[class*='popup']",
+    "[class*='overlay']"
+)
+_MODAL_SELECTOR = ", ".join(_MODAL_SELECTORS)
+_NAV_SELECTOR = "nav, [role='navigation']"
+_DROPDOWN_SELECTOR = "select, [role='listbox'], [role='combobox']"
+_TABLIST_SELECTOR = "[role='tablist']"
+_TAB_SELECTOR = "[role='tab']"
+_TOGGLE_SELECTOR = "[role='switch'], [type='checkbox']"
+_SLIDER_SELECTOR = "[role='slider'], input[type='range']"
+_INTERACTIVE_KINDS = (
+    ("dropdown", _DROPDOWN_SELECTOR),
+    ("tabs", _TABLIST_SELECTOR),
+    ("toggle", _TOGGLE_SELECTOR),
+    ("slider", _SLIDER_SELECTOR)
+)
+_INTERACTIVE_SELECTOR = ", ".join(sel for _, sel in _INTERACTIVE_KINDS)
+
+
+# 요소 타입별 추출 스크립트 (_EXTRACT_JS로 합쳐 evaluate 한 번에 실행 → CDP 왕복 최소화)
+# 선택자 우선순위: id > data-testid > 첫 번째 클래스
+_SELECTOR_JS = """
+const sel = el => {
+    if (el.id) return '#' + el.id;
+    const testid = el.getAttribute('data-testid');
+    if (testid) return `[data-testid='${testid}']`;
+    const cls = el.getAttribute('class');
+    if (cls && cls.trim()) return '.' + cls.trim().split(/\\s+/)[0];
+    return '';
+};
+const text = el => (el.innerText || '').trim();
+"""
+
+_BUTTONS_JS = "() => {" + _SELECTOR_JS + """
+    // 최대 개수가 차면 더 읽지 않음 (큰 DOM에서 innerText 계산/직렬화 절약)
+    const buttons = [];
+    for (const el of document.querySelectorAll(%s)) {
+        if (buttons.length >= 30) return buttons;
+        const t = text(el);
+        if (t) buttons.push({text: t.slice(0, 50), selector: sel(el), type: el.getAttribute('type') || 'button', disabled: el.disabled});
+    }
+    const seen = new Set(buttons.map(b => b.text));
+    for (const el of document.querySelectorAll(%s)) {
+        if (buttons.length >= 30) return buttons;
+        const key = text(el).slice(0, 50);
+        if (!key || seen.has(key)) continue;
+        seen.add(key);
+        buttons.push({text: key, selector: sel(el), type: 'role-button', disabled: false});
+    }
+    for (const el of document.querySelectorAll(%s)) {
+        if (buttons.length >= 30) return buttons;
+        const t = el.getAttribute('value') || '';
+        if (t) buttons.push({text: t.slice(0, 50), selector: sel(el), type: 'input-button', disabled: el.disabled});
+    }
+    return buttons;
+}""" % (json.dumps(_BUTTON_SELECTOR), json.dumps(_ROLE_BUTTON_SELECTOR), json.dumps(_INPUT_BUTTON_SELECTOR))
+
+_LINKS_JS = "(withSelectors) => {" + _SELECTOR_JS + """
+    // 버려질 href(#, javascript:)는 건너뛰고 50개까지만 (_build_links 상한)
+    const links = [];
+    for (const el of document.querySelectorAll(%s)) {
+        const href = el.getAttribute('href');
+        if (!href || href.startsWith('#') || href.startsWith('javascript:')) continue;
+        links.push({text: text(el), href, selector: withSelectors ? sel(el) : null});
+        if (links.length >= 50) break;
+    }
+    return links;
+}""" % json.dumps(_LINK_SELECTOR)
+
+_FORMS_JS = "() => {" + _SELECTOR_JS + """
+    return [...document.querySelectorAll('form')].map(form => {
+        const fields = [];
+        for (const el of form.querySelectorAll(%s)) {
+            if (fields.length >= 20) break;
+            const name = el.getAttribute('name') || el.getAttribute('id');
+            if (name) fields.push({
+                name, type: el.getAttribute('type') || 'text',
+                placeholder: el.getAttribute('placeholder'), required: el.hasAttribute('required')
+            });
+        }
+        return {
+            id: form.getAttribute('id'), action: form.getAttribute('action'),
+            method: (form.getAttribute('method') || 'GET').toUpperCase(),
+            fields, selector: sel(form)
+        };
+    });
+}""" % json.dumps(_FIELD_SELECTOR)
+
+_INPUTS_JS = "() => {" + _SELECTOR_JS + """
+    const inputs = [];
+    for (const el of document.querySelectorAll('input:not(form input), textarea:not(form textarea)')) {
+        if (inputs.length >= 20) break;
+        const name = el.getAttribute('name') || el.getAttribute('id');
+        const placeholder = el.getAttribute('placeholder');
+        if (name || placeholder) inputs.push({name, type: el.getAttribute('type') || 'text', placeholder, selector: sel(el)});
+    }
+    return inputs;
+}"""
+
+_MODALS_JS = """() => {
+    const selectors = %s;
+    // 한 번의 쿼리로 탐색 → 여러 선택자에 걸리는 요소도 한 번만 반환
+    return [...document.querySelectorAll(%s)].map(el => {
+        const style = getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        return {
+            id: el.getAttribute('id'), label: el.getAttribute('aria-label'),
+            visible: style.visibility !== 'hidden' && rect.width > 0 && rect.height > 0,
+            selector: selectors.find(s => el.matches(s))
+        };
+    });
+}""" % (json.dumps(list(_MODAL_SELECTORS)), json.dumps(_MODAL_SELECTOR))
+
+_NAVIGATION_JS = "() => {" + _SELECTOR_JS + """
+    const items = [];
+    for (const nav of document.querySelectorAll(%s)) {
+        for (const a of nav.querySelectorAll('a')) {
+            if (items.length >= 20) return items;
+            const t = text(a);
+            if (t) items.push({text: t.slice(0, 30), href: a.getAttribute('href')});
+        }
+    }
+    return items;
+}""" % json.dumps(_NAV_SELECTOR)
+
+_INTERACTIVE_JS = """() => {
+    const label = el => el.getAttribute('aria-label') || el.getAttribute('name');
+    const kinds = %s;
+    // 한 번의 탐색으로 타입별로 나눈 뒤 타입 순서대로 30개까지 (타입별 쿼리 4번 → 1번)
+    const groups = kinds.map(() => []);
+    for (const el of document.querySelectorAll(%s))
+        groups[kinds.findIndex(([, s]) => el.matches(s))].push(el);
+    const items = [];
+    for (const [i, els] of groups.entries()) {
+        const type = kinds[i][0];
+        for (const el of els) {
+            if (items.length >= 30) return items;
+            items.push(type === 'tabs'
+                ? {type, items: [...el.querySelectorAll(%s)].slice(0, 10).map(t => t.innerText)}
+                : {type, label: label(el)});
+        }
+    }
+    return items;
+}""" % (json.dumps(_INTERACTIVE_KINDS), json.dumps(_INTERACTIVE_SELECTOR), json.dumps(_TAB_SELECTOR))
+
+# 전체 추출을 evaluate 한 번으로 (페이지 분석 시 CDP 왕복 1회)
+_EXTRACT_JS = "(withSelectors) => ({" + ", ".join(
+    f"{name}: ({js})(withSelectors)" for name, js in (
+        ("buttons", _BUTTONS_JS),
+        ("links", _LINKS_JS),
+        ("forms", _FORMS_JS),
+        ("inputs", _INPUTS_JS),
+        ("modals", _MODALS_JS),
+        ("navigation", _NAVIGATION_JS),
+        ("interactive", _INTERACTIVE_JS)
+    )
+) + "})"
+
 
 @dataclass
 class UIElement:
@@ -53,84 +264,355 @@ class PageAnalysis:
     modals: list
     navigation: list
     interactive_elements: list
-    screenshots: dict  # {"full": path, "viewport": path}
+    screenshots: dict  # {"viewport": path, "full": path (capture_full_page 시)}
+
+
+def _static_selector(node) -> str:
+    """정적 노드 선택자 (_SELECTOR_JS와 같은 우선순위)"""
+    attrs = node.attributes
+    if attrs.get("id"):
+        return f"#{attrs['id']}"
+    if attrs.get("data-testid"):
+        return f"[data-testid='{attrs['data-testid']}']"
+    classes = (attrs.get("class") or "").split()
+    if classes:
+        return f".{classes[0]}"
+    return ""
+
+
+def _static_text(node) -> str:
+    return node.text(separator=" ", strip=True)
+
+
+def _has_form_ancestor(node) -> bool:
+    parent = node.parent
+    while parent is not None:
+        if parent.tag == "form":
+            return True
+        parent = parent.parent
+    return False
+
+
+def _extract_static(html: str, link_selectors: bool = False) -> dict:
+    """
+    정적 HTML에서 요소 추출 (브라우저 없이)
+
+    _EXTRACT_JS와 같은 형태의 dict 목록 반환 (links는 가공 전 원본, 선택자는 link_selectors일 때만)
+    """
+    tree = LexborHTMLParser(html)
+    title_node = tree.css_first("title")
+
+    buttons = []
+    for el in tree.css(_BUTTON_SELECTOR):
+        text = _static_text(el)
+        if text:
+            buttons.append({
+                "text": text[:50],
+                "selector": _static_selector(el),
+                "type": el.attributes.get("type") or "button",
+                "disabled": "disabled" in el.attributes
+            })
+    seen = {b["text"] for b in buttons}
+    for el in tree.css(_ROLE_BUTTON_SELECTOR):
+        key = _static_text(el)[:50]
+        if key and key not in seen:
+            seen.add(key)
+            buttons.append({"text": key, "selector": _static_selector(el), "type": "role-button", "disabled": False})
+    for el in tree.css(_INPUT_BUTTON_SELECTOR):
+        text = el.attributes.get("value") or ""
+        if text:
+            buttons.append({
+                "text": text[:50],
+                "selector": _static_selector(el),
+                "type": "input-button",
+                "disabled": "disabled" in el.attributes
+            })
+
+    links = [
+        {"text": _static_text(el), "href": el.attributes.get("href"), "selector": _static_selector(el) if link_selectors else None}
+        for el in tree.css(_LINK_SELECTOR)
+    ]
+
+    forms = []
+    for form in tree.css("form"):
+        fields = []
+        for el in form.css(_FIELD_SELECTOR):
+            name = el.attributes.get("name") or el.attributes.get("id")
+            if name:
+                fields.append({
+                    "name": name,
+                    "type": el.attributes.get("type") or "text",
+                    "placeholder": el.attributes.get("placeholder"),
+                    "required": "required" in el.attributes
+                })
+        forms.append({
+            "id": form.attributes.get("id"),
+            "action": form.attributes.get("action"),
+            "method": (form.attributes.get("method") or "GET").upper(),
+            "fields": fields[:20],
+            "selector": _static_selector(form)
+        })
+
+    inputs = []
+    for el in tree.css("input, textarea"):
+        if _has_form_ancestor(el):
+            continue
+        name = el.attributes.get("name") or el.attributes.get("id")
+        placeholder = el.attributes.get("placeholder")
+        if name or placeholder:
+            inputs.append({
+                "name": name,
+                "type": el.attributes.get("type") or "text",
+                "placeholder": placeholder,
+                "selector": _static_selector(el)
+            })
+
+    modals = []
+    seen_nodes = set()
+    for el in tree.css(_MODAL_SELECTOR):
+        if el.mem_id in seen_nodes:
+            continue
+        seen_nodes.add(el.mem_id)
+        style = (el.attributes.get("style") or "").replace(" ", "")
+        modals.append({
+            "id": el.attributes.get("id"),
+            "label": el.attributes.get("aria-label"),
+            # 레이아웃 정보가 없으므로 hidden 속성/인라인 스타일로만 판단
+            "visible": "hidden" not in el.attributes and "display:none" not in style,
+            "selector": next((sel for sel in _MODAL_SELECTORS if el.css_matches(sel)), "")
+        })
+
+    navigation = []
+    for nav in tree.css(_NAV_SELECTOR):
+        for a in nav.css("a"):
+            text = _static_text(a)
+            if text:
+                navigation.append({"text": text[:30], "href": a.attributes.get("href")})
+
+    def label(el):
+        return el.attributes.get("aria-label") or el.attributes.get("name")
+
+    interactive = []
+    for el in tree.css(_DROPDOWN_SELECTOR):
+        interactive.append({"type": "dropdown", "label": label(el)})
+    for el in tree.css(_TABLIST_SELECTOR):
+        interactive.append({"type": "tabs", "items": [t.text() for t in el.css(_TAB_SELECTOR)][:10]})
+    for el in tree.css(_TOGGLE_SELECTOR):
+        interactive.append({"type": "toggle", "label": label(el)})
+    for el in tree.css(_SLIDER_SELECTOR):
+        interactive.append({"type": "slider", "label": label(el)})
+
+    return {
+        "title": title_node.text(strip=True) if title_node else "",
+        "buttons": buttons[:30],
+        "links": links,
+        "forms": forms,
+        "inputs": inputs[:20],
+        "modals": modals,
+        "navigation": navigation[:20],
+        "interactive": interactive[:30]
+    }
+
+
+def _blocking_route(blocked: frozenset):
+    """blocked 리소스 타입 요청을 중단하는 라우트 핸들러"""
+    async def handle_route(route):
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    return handle_route
+
+
+def _dumps_pretty(data) -> bytes:
+    """JSON 직렬화 (들여쓰기 2칸, UTF-8 bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# 이벤트 루프 단위 공유 브라우저 (SiteCrawler마다 chromium을 새로 띄우지 않음)
+# 루프가 끝나기 전에 SiteCrawler.shutdown() 필요 (browser_session() 또는 동기 래퍼가 대신 호출)
+_BROWSER_SINGLETON: dict = {"loop": None, "lock": None, "playwright": None, "browsers": {}}
+
+
+async def _get_shared_browser(headless: bool) -> "Browser":
+    """공유 브라우저 반환 (없으면 실행)"""
+    loop = asyncio.get_running_loop()
+    if _BROWSER_SINGLETON["loop"] is not loop:
+        # Playwright 객체는 생성한 이벤트 루프에 묶여 다른 루프에서 닫을 수 없음
+        # → 종료 안 된 채 남아 있으면 chromium이 고아가 되므로 새로 띄우지 않고 거부
+        if _BROWSER_SINGLETON["playwright"] is not None:
+            raise RuntimeError(
+                "Shared browser is still open on another event loop. "
+                "Call SiteCrawler.shutdown() (or use browser_session()) before that loop ends."
+            )
+        _BROWSER_SINGLETON.update(loop=loop, lock=asyncio.Lock(), playwright=None, browsers={})
+
+    async with _BROWSER_SINGLETON["lock"]:
+        if _BROWSER_SINGLETON["playwright"] is None:
+            _BROWSER_SINGLETON["playwright"] = await async_playwright().start()
+
+        browser = _BROWSER_SINGLETON["browsers"].get(headless)
+        if browser is None or not browser.is_connected():
+            browser = await _BROWSER_SINGLETON["playwright"].chromium.launch(headless=headless)
+            _BROWSER_SINGLETON["browsers"][headless] = browser
+        return browser
 
 
 class SiteCrawler:
-    def __init__(self, headless: bool = True, auth_site: Optional[str] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        auth_site: Optional[str] = None,
+        reuse_page: bool = False,
+        screenshot_format: str = "jpeg",
+        screenshot_quality: int = 70,
+        take_viewport: bool = False,
+        capture_full_page: bool = False,
+        static_fast_path: bool = True,
+        block_resources: bool = True,
+        wait_strategy: str = "networkidle",
+        settle_timeout_ms: int = 3000,
+        link_selectors: bool = False
+    ):
         """
         Args:
             headless: 브라우저 숨김 모드
             auth_site: 인증에 사용할 사이트 이름 (저장된 쿠키 사용)
+            reuse_page: 페이지 하나를 유지하며 goto로 이동 (같은 사이트 연속 분석 시)
+            screenshot_format: 스크린샷 형식 ("jpeg" 또는 "png")
+            screenshot_quality: JPEG 품질 (png에는 적용 안 됨)
+            take_viewport: 전체 페이지 샷과 함께 뷰포트 스크린샷도 저장
+            capture_full_page: 전체 페이지 스크린샷 저장 (긴 페이지는 인코딩이 느리므로 기본 off → 뷰포트만)
+            static_fast_path: 정적 HTML 페이지는 브라우저 없이 분석 (httpx/selectolax 설치 시)
+            block_resources: 이미지/폰트/미디어 등 분석에 불필요한 리소스 요청 차단
+            wait_strategy: DOM 로드 후 추가로 기다릴 load state ("networkidle", "load", "domcontentloaded")
+            settle_timeout_ms: wait_strategy 최대 대기 시간 (넘으면 그대로 진행)
+            link_selectors: 링크마다 CSS 선택자도 추출 (링크가 많은 페이지는 느려지므로 기본 off)
         """
         self.headless = headless
         self.auth_site = auth_site
+        self.reuse_page = reuse_page
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.take_viewport = take_viewport
+        self.capture_full_page = capture_full_page
+        self.static_fast_path = static_fast_path
+        self.block_resources = block_resources
+        self.wait_strategy = wait_strategy
+        self.settle_timeout_ms = settle_timeout_ms
+        self.link_selectors = link_selectors
+        self._http = None
+        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context = None
+        self._context_lock = None
+        self._pages = {}  # reuse_page 시 스크린샷 여부별 페이지 (차단 라우트가 다름)
         self.results = []
 
     async def __aenter__(self):
         if not PLAYWRIGHT_AVAILABLE:
             raise RuntimeError("Playwright not installed. Run: python3 src/install.py")
 
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-
-        # 브라우저 컨텍스트 생성
-        self.context = await self.browser.new_context()
-
-        # 인증 쿠키 적용
-        if self.auth_site and AUTH_AVAILABLE:
-            cookies = load_cookies(self.auth_site)
-            if cookies:
-                await self.context.add_cookies(cookies)
-                print(f"✅ 인증 쿠키 적용: {self.auth_site} ({len(cookies)}개)")
-            else:
-                print(f"⚠️ 저장된 인증 없음: {self.auth_site}")
-                print(f"   python3 src/auth_manager.py login <url> {self.auth_site}")
+        # 정적 경로는 인증 상태를 쓸 수 없으므로 비인증 크롤링에서만 사용
+        if self.static_fast_path and STATIC_AVAILABLE and not self.auth_site:
+            self._http = httpx.AsyncClient(follow_redirects=True, timeout=5)
 
+        # 브라우저/컨텍스트는 정적 경로로 안 될 때 처음 만듦 (모든 페이지가 정적이면 chromium 실행 안 함)
+        self._context_lock = asyncio.Lock()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._http:
+            await self._http.aclose()
+        for page in self._pages.values():
+            await page.close()
+        # 브라우저는 공유하므로 컨텍스트만 닫음 (종료는 shutdown())
         if self.context:
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+
+    @classmethod
+    async def shutdown(cls):
+        """공유 브라우저/Playwright 종료 (브라우저를 띄운 이벤트 루프가 끝나기 전 호출)"""
+        if _BROWSER_SINGLETON["loop"] is not asyncio.get_running_loop():
+            return
+
+        async with _BROWSER_SINGLETON["lock"]:
+            for browser in _BROWSER_SINGLETON["browsers"].values():
+                await browser.close()
+            if _BROWSER_SINGLETON["playwright"]:
+                await _BROWSER_SINGLETON["playwright"].stop()
+            _BROWSER_SINGLETON.update(playwright=None, browsers={})
 
     async def analyze_page(self, url: str, screenshot_dir: Optional[str] = None) -> PageAnalysis:
         """단일 페이지 분석"""
-        page = await self.context.new_page()
+        # 정적 HTML로 충분한 페이지는 브라우저 없이 분석 (스크린샷 필요 시 제외)
+        if self._http and not screenshot_dir:
+            analysis = await self._try_static(url)
+            if analysis:
+                return analysis
+
+        # 모든 페이지는 하나의 컨텍스트에서 열어 쿠키/HTTP 캐시 공유
+        if self.reuse_page:
+            with_screenshots = bool(screenshot_dir)
+            if with_screenshots not in self._pages:
+                self._pages[with_screenshots] = await self._new_page(screenshot_dir)
+            page = self._pages[with_screenshots]
+        else:
+            page = await self._new_page(screenshot_dir)
 
         try:
-            # load로 변경 (networkidle은 일부 SPA에서 타임아웃)
-            await page.goto(url, wait_until="load", timeout=60000)
-            await page.wait_for_timeout(2000)  # 동적 콘텐츠 로딩 대기
-
-            title = await page.title()
-
-            # 각 요소 타입 추출
-            buttons = await self._extract_buttons(page)
-            links = await self._extract_links(page, url)
-            forms = await self._extract_forms(page)
-            inputs = await self._extract_inputs(page)
-            modals = await self._extract_modals(page)
-            navigation = await self._extract_navigation(page)
-            interactive = await self._extract_interactive(page)
-
-            # 스크린샷
+            # DOM 준비되면 진행, 네트워크 안정은 짧게만 기다림 (SPA 롱폴링/웹소켓은 idle이 안 됨)
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            if self.wait_strategy != "domcontentloaded":
+                try:
+                    await page.wait_for_load_state(self.wait_strategy, timeout=self.settle_timeout_ms)
+                except PlaywrightTimeoutError:
+                    pass
+
+            # 동적 콘텐츠: 로딩 완료 + aria-busy 요소가 없을 때까지 짧게 대기
+            try:
+                await page.wait_for_function(
+                    "document.readyState === 'complete' && !document.querySelector('[aria-busy=true]')",
+                    timeout=2000
+                )
+            except PlaywrightTimeoutError:
+                pass
+
+            # 스크린샷 (인코딩이 오래 걸리므로 먼저 시작해 요소 추출과 겹치게)
             screenshots = {}
+            shot_tasks = []
             if screenshot_dir:
                 from pathlib import Path
                 Path(screenshot_dir).mkdir(parents=True, exist_ok=True)
 
                 safe_name = urlparse(url).path.replace("/", "_") or "index"
-                screenshots["viewport"] = f"{screenshot_dir}/{safe_name}_viewport.png"
-                screenshots["full"] = f"{screenshot_dir}/{safe_name}_full.png"
-
-                await page.screenshot(path=screenshots["viewport"])
-                await page.screenshot(path=screenshots["full"], full_page=True)
+                ext = "jpg" if self.screenshot_format == "jpeg" else "png"
+                options = {"type": self.screenshot_format}
+                if self.screenshot_format == "jpeg":
+                    options["quality"] = self.screenshot_quality
+
+                if self.take_viewport or not self.capture_full_page:
+                    screenshots["viewport"] = f"{screenshot_dir}/{safe_name}_viewport.{ext}"
+                if self.capture_full_page:
+                    screenshots["full"] = f"{screenshot_dir}/{safe_name}_full.{ext}"
+
+                shot_tasks = [
+                    asyncio.create_task(page.screenshot(path=path, full_page=(kind == "full"), **options))
+                    for kind, path in screenshots.items()
+                ]
+
+            try:
+                # 제목/요소 추출 동시 실행 (읽기 전용 쿼리)
+                title, (buttons, links, forms, inputs, modals, navigation, interactive) = await asyncio.gather(
+                    page.title(),
+                    self._extract_all(page, url)
+                )
+            finally:
+                # 추출이 실패해도 스크린샷 태스크는 페이지 닫기 전에 정리
+                await asyncio.gather(*shot_tasks)
 
             return PageAnalysis(
                 url=url,
@@ -146,278 +628,221 @@ class SiteCrawler:
             )
 
         finally:
-            await page.close()
+            if not self.reuse_page:
+                await page.close()
+
+    async def crawl_sites(self, urls: list, screenshot_dir: Optional[str] = None, concurrency: int = 4) -> list:
+        """여러 페이지 동시 분석 (urls 순서대로 PageAnalysis 반환)"""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1 (got {concurrency})")
+
+        # 재사용 페이지는 하나뿐이라 동시에 쓸 수 없음
+        if self.reuse_page:
+            concurrency = 1
+        sem = asyncio.Semaphore(concurrency)
+
+        async def analyze_one(url: str) -> PageAnalysis:
+            async with sem:
+                return await self.analyze_page(url, screenshot_dir)
+
+        return list(await asyncio.gather(*(analyze_one(url) for url in urls)))
+
+    async def _ensure_context(self):
+        """브라우저 컨텍스트 반환 (처음 호출 시 공유 브라우저에서 생성)"""
+        async with self._context_lock:
+            if self.context is None:
+                self.context = await self._create_context()
+        return self.context
+
+    async def _create_context(self):
+        """공유 브라우저에 컨텍스트 생성 (인증 상태, 리소스 차단 적용)"""
+        self.browser = await _get_shared_browser(self.headless)
+        self.playwright = _BROWSER_SINGLETON["playwright"]
+
+        # 인증 상태 (쿠키 + localStorage)는 컨텍스트 생성 시 한 번에 적용
+        storage_state = None
+        if self.auth_site and AUTH_AVAILABLE:
+            storage_state = get_storage_state_path(self.auth_site)
+            if storage_state:
+                logger.info("✅ 인증 상태 적용: %s", self.auth_site)
+            else:
+                logger.warning(
+                    "⚠️ 저장된 인증 없음: %s (python3 src/auth_manager.py login <url> %s)",
+                    self.auth_site, self.auth_site
+                )
 
-    async def _extract_buttons(self, page: Page) -> list:
-        """버튼 요소 추출"""
-        buttons = []
+        # 브라우저 컨텍스트 생성
+        context = await self.browser.new_context(
+            storage_state=str(storage_state) if storage_state else None
+        )
 
-        # <button> 태그
-        for btn in await page.query_selector_all("button"):
-            text = (await btn.inner_text()).strip()
-            if text:
-                buttons.append({
-                    "text": text[:50],
-                    "selector": await self._get_selector(btn),
-                    "type": await btn.get_attribute("type") or "button",
-                    "disabled": await btn.is_disabled()
-                })
+        # 리소스 차단 라우트는 컨텍스트에 한 번만 등록 (모든 페이지에 적용)
+        if self.block_resources:
+            await context.route("**/*", _blocking_route(BLOCKED_RESOURCE_TYPES))
 
-        # role="button" 요소
-        for btn in await page.query_selector_all("[role='button']"):
-            text = (await btn.inner_text()).strip()
-            if text and text not in [b["text"] for b in buttons]:
-                buttons.append({
-                    "text": text[:50],
-                    "selector": await self._get_selector(btn),
-                    "type": "role-button",
-                    "disabled": False
-                })
+        return context
 
-        # input[type="submit"]
-        for btn in await page.query_selector_all("input[type='submit'], input[type='button']"):
-            text = await btn.get_attribute("value") or ""
-            if text:
-                buttons.append({
-                    "text": text[:50],
-                    "selector": await self._get_selector(btn),
-                    "type": "input-button",
-                    "disabled": await btn.is_disabled()
-                })
+    async def _new_page(self, screenshot_dir: Optional[str] = None) -> Page:
+        """새 페이지 (불필요한 리소스 차단 라우트 등록)"""
+        context = await self._ensure_context()
+        page = await context.new_page()
 
-        return buttons[:30]  # 최대 30개
+        # 기본 차단은 컨텍스트 라우트가 처리, 스크린샷 페이지만 완화된 라우트로 덮어씀
+        if self.block_resources and screenshot_dir:
+            await page.route("**/*", _blocking_route(BLOCKED_RESOURCE_TYPES_WITH_SCREENSHOT))
 
-    async def _extract_links(self, page: Page, base_url: str) -> list:
-        """링크 추출 (내부/외부 구분)"""
+        return page
+
+    async def _try_static(self, url: str) -> Optional[PageAnalysis]:
+        """정적 HTML 분석 시도 (클라이언트 렌더링 페이지로 보이면 None)"""
+        try:
+            response = await self._http.get(url)
+        except httpx.HTTPError:
+            return None
+
+        if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+            return None
+        if len(response.content) < STATIC_MIN_HTML_BYTES:
+            return None
+
+        data = _extract_static(response.text, self.link_selectors)
+        if len(data["buttons"]) < STATIC_MIN_BUTTONS:
+            return None
+
+        return PageAnalysis(
+            url=url,
+            title=data["title"],
+            buttons=data["buttons"],
+            links=self._build_links(data["links"], url, self.link_selectors),
+            forms=data["forms"],
+            inputs=data["inputs"],
+            modals=data["modals"],
+            navigation=data["navigation"],
+            interactive_elements=data["interactive"],
+            screenshots={}
+        )
+
+    async def _extract_all(self, page: Page, base_url: str) -> tuple:
+        """모든 요소 타입을 evaluate 한 번으로 추출"""
+        data = await page.evaluate(_EXTRACT_JS, self.link_selectors)
+        return (
+            data["buttons"],
+            self._build_links(data["links"], base_url, self.link_selectors),
+            data["forms"],
+            data["inputs"],
+            data["modals"],
+            data["navigation"],
+            data["interactive"]
+        )
+
+    def _build_links(self, raw_links: list, base_url: str, with_selectors: bool = False) -> list:
+        """원본 href 목록 → 절대 URL + 내부/외부 구분"""
         links = []
-        base_domain = urlparse(base_url).netloc
+        base_parsed = urlparse(base_url)
+        base_domain = base_parsed.netloc
+        base_prefix = f"{base_parsed.scheme}://{base_domain}"
 
-        for link in await page.query_selector_all("a[href]"):
-            href = await link.get_attribute("href")
-            text = (await link.inner_text()).strip()
+        for link in raw_links:
+            href = link["href"]
 
             if not href or href.startswith("#") or href.startswith("javascript:"):
                 continue
 
-            full_url = urljoin(base_url, href)
-            is_internal = urlparse(full_url).netloc == base_domain
+            # 흔한 경우(같은 출처 절대경로/루트 상대경로)는 URL 파싱 없이 처리
+            # ("/./", "/../" 같은 점 세그먼트는 정규화가 필요하므로 urljoin으로)
+            if "/." in href:
+                full_url = urljoin(base_url, href)
+                is_internal = urlparse(full_url).netloc == base_domain
+            elif href.startswith("/") and not href.startswith("//"):
+                full_url = base_prefix + href
+                is_internal = True
+            elif href.startswith(base_prefix) and href[len(base_prefix):len(base_prefix) + 1] in ("", "/", "?", "#"):
+                full_url = href
+                is_internal = True
+            elif href.startswith(("http://", "https://")):
+                # 다른 출처 절대 URL: 호스트 부분만 잘라 비교
+                full_url = href
+                is_internal = _HOST_END_RE.split(href.split("://", 1)[1], 1)[0] == base_domain
+            else:
+                full_url = urljoin(base_url, href)
+                is_internal = urlparse(full_url).netloc == base_domain
 
-            links.append({
-                "text": text[:50] if text else "[no text]",
+            item = {
+                "text": link["text"][:50] if link["text"] else "[no text]",
                 "href": full_url,
-                "internal": is_internal,
-                "selector": await self._get_selector(link)
-            })
+                "internal": is_internal
+            }
+            if with_selectors:
+                item["selector"] = link["selector"]
+            links.append(item)
 
         return links[:50]  # 최대 50개
 
-    async def _extract_forms(self, page: Page) -> list:
-        """폼 추출"""
-        forms = []
-
-        for form in await page.query_selector_all("form"):
-            form_id = await form.get_attribute("id")
-            action = await form.get_attribute("action")
-            method = await form.get_attribute("method") or "GET"
-
-            # 폼 내부 필드 수집
-            fields = []
-            for input_el in await form.query_selector_all("input, select, textarea"):
-                field_type = await input_el.get_attribute("type") or "text"
-                field_name = await input_el.get_attribute("name") or await input_el.get_attribute("id")
-                placeholder = await input_el.get_attribute("placeholder")
-                required = await input_el.get_attribute("required") is not None
-
-                if field_name:
-                    fields.append({
-                        "name": field_name,
-                        "type": field_type,
-                        "placeholder": placeholder,
-                        "required": required
-                    })
-
-            forms.append({
-                "id": form_id,
-                "action": action,
-                "method": method.upper(),
-                "fields": fields[:20],  # 최대 20개 필드
-                "selector": await self._get_selector(form)
-            })
-
-        return forms
-
-    async def _extract_inputs(self, page: Page) -> list:
-        """폼 외부 입력 필드 추출"""
-        inputs = []
-
-        for input_el in await page.query_selector_all("input:not(form input), textarea:not(form textarea)"):
-            field_type = await input_el.get_attribute("type") or "text"
-            field_name = await input_el.get_attribute("name") or await input_el.get_attribute("id")
-            placeholder = await input_el.get_attribute("placeholder")
-
-            if field_name or placeholder:
-                inputs.append({
-                    "name": field_name,
-                    "type": field_type,
-                    "placeholder": placeholder,
-                    "selector": await self._get_selector(input_el)
-                })
-
-        return inputs[:20]
-
-    async def _extract_modals(self, page: Page) -> list:
-        """모달/다이얼로그 추출"""
-        modals = []
-
-        selectors = [
-            "[role='dialog']",
-            "[role='alertdialog']",
-            ".modal",
-            ".dialog",
-            "[class*='modal']",
-            "[class*='popup']",
-            "[class*='overlay']"
-        ]
-
-        for selector in selectors:
-            for modal in await page.query_selector_all(selector):
-                modal_id = await modal.get_attribute("id")
-                aria_label = await modal.get_attribute("aria-label")
-                is_visible = await modal.is_visible()
-
-                modals.append({
-                    "id": modal_id,
-                    "label": aria_label,
-                    "visible": is_visible,
-                    "selector": selector
-                })
-
-        return modals
-
-    async def _extract_navigation(self, page: Page) -> list:
-        """네비게이션 요소 추출"""
-        nav_items = []
-
-        for nav in await page.query_selector_all("nav, [role='navigation']"):
-            for link in await nav.query_selector_all("a"):
-                text = (await link.inner_text()).strip()
-                href = await link.get_attribute("href")
-
-                if text:
-                    nav_items.append({
-                        "text": text[:30],
-                        "href": href
-                    })
-
-        return nav_items[:20]
-
-    async def _extract_interactive(self, page: Page) -> list:
-        """기타 인터랙티브 요소 추출"""
-        interactive = []
-
-        # 드롭다운
-        for el in await page.query_selector_all("select, [role='listbox'], [role='combobox']"):
-            label = await el.get_attribute("aria-label") or await el.get_attribute("name")
-            interactive.append({"type": "dropdown", "label": label})
-
-        # 탭
-        for el in await page.query_selector_all("[role='tablist']"):
-            tabs = await el.query_selector_all("[role='tab']")
-            tab_names = [await t.inner_text() for t in tabs]
-            interactive.append({"type": "tabs", "items": tab_names[:10]})
-
-        # 토글/스위치
-        for el in await page.query_selector_all("[role='switch'], [type='checkbox']"):
-            label = await el.get_attribute("aria-label") or await el.get_attribute("name")
-            interactive.append({"type": "toggle", "label": label})
-
-        # 슬라이더
-        for el in await page.query_selector_all("[role='slider'], input[type='range']"):
-            label = await el.get_attribute("aria-label") or await el.get_attribute("name")
-            interactive.append({"type": "slider", "label": label})
-
-        return interactive[:30]
-
-    async def _get_selector(self, element) -> str:
-        """요소의 고유 선택자 생성"""
-        # ID가 있으면 사용
-        el_id = await element.get_attribute("id")
-        if el_id:
-            return f"#{el_id}"
-
-        # data-testid 사용
-        testid = await element.get_attribute("data-testid")
-        if testid:
-            return f"[data-testid='{testid}']"
-
-        # 클래스 기반
-        classes = await element.get_attribute("class")
-        if classes:
-            main_class = classes.split()[0]
-            return f".{main_class}"
-
-        return ""
-
     def to_markdown(self, analysis: PageAnalysis) -> str:
         """분석 결과를 마크다운으로 변환"""
-        md = f"# 페이지 분석: {analysis.title}\n\n"
-        md += f"**URL:** {analysis.url}\n\n"
+        parts = [
+            f"# 페이지 분석: {analysis.title}\n\n",
+            f"**URL:** {analysis.url}\n\n"
+        ]
 
         if analysis.buttons:
-            md += "## 버튼\n\n"
-            md += "| 텍스트 | 타입 | 선택자 |\n|--------|------|--------|\n"
-            for btn in analysis.buttons:
-                md += f"| {btn['text']} | {btn['type']} | `{btn['selector']}` |\n"
-            md += "\n"
+            parts.append("## 버튼\n\n")
+            parts.append("| 텍스트 | 타입 | 선택자 |\n|--------|------|--------|\n")
+            parts.extend(f"| {btn['text']} | {btn['type']} | `{btn['selector']}` |\n" for btn in analysis.buttons)
+            parts.append("\n")
 
         if analysis.forms:
-            md += "## 폼\n\n"
+            parts.append("## 폼\n\n")
             for form in analysis.forms:
-                md += f"### {form['id'] or '(no id)'}\n"
-                md += f"- Method: {form['method']}\n"
-                md += f"- Action: {form['action']}\n"
-                md += "- Fields:\n"
-                for field in form['fields']:
-                    req = " (필수)" if field['required'] else ""
-                    md += f"  - `{field['name']}` ({field['type']}){req}\n"
-                md += "\n"
+                parts.append(f"### {form['id'] or '(no id)'}\n")
+                parts.append(f"- Method: {form['method']}\n")
+                parts.append(f"- Action: {form['action']}\n")
+                parts.append("- Fields:\n")
+                parts.extend(
+                    f"  - `{field['name']}` ({field['type']}){' (필수)' if field['required'] else ''}\n"
+                    for field in form['fields']
+                )
+                parts.append("\n")
 
         if analysis.navigation:
-            md += "## 네비게이션\n\n"
-            for nav in analysis.navigation:
-                md += f"- [{nav['text']}]({nav['href']})\n"
-            md += "\n"
+            parts.append("## 네비게이션\n\n")
+            parts.extend(f"- [{nav['text']}]({nav['href']})\n" for nav in analysis.navigation)
+            parts.append("\n")
 
         if analysis.interactive_elements:
-            md += "## 인터랙티브 요소\n\n"
-            for el in analysis.interactive_elements:
-                md += f"- **{el['type']}**: {el.get('label') or el.get('items', '')}\n"
-            md += "\n"
+            parts.append("## 인터랙티브 요소\n\n")
+            parts.extend(
+                f"- **{el['type']}**: {el.get('label') or el.get('items', '')}\n"
+                for el in analysis.interactive_elements
+            )
+            parts.append("\n")
 
         if analysis.links:
             internal = [l for l in analysis.links if l['internal']]
-            external = [l for l in analysis.links if not l['internal']]
-
-            md += f"## 링크 (내부: {len(internal)}, 외부: {len(external)})\n\n"
-            md += "### 주요 내부 링크\n"
-            for link in internal[:10]:
-                md += f"- [{link['text']}]({link['href']})\n"
-            md += "\n"
+            external_count = len(analysis.links) - len(internal)
 
-        return md
+            parts.append(f"## 링크 (내부: {len(internal)}, 외부: {external_count})\n\n")
+            parts.append("### 주요 내부 링크\n")
+            parts.extend(f"- [{link['text']}]({link['href']})\n" for link in internal[:10])
+            parts.append("\n")
 
+        return "".join(parts)
 
-async def crawl_site(url: str, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True) -> dict:
+async def crawl_site(url: str, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True, capture_full_page: bool = False) -> dict:
     """
     사이트 크롤링 메인 함수
 
+    공유 브라우저를 쓰므로 async 호출자는 끝날 때 SiteCrawler.shutdown() 호출
+    (또는 browser_session() 안에서 호출, 동기 버전은 crawl_site_sync)
+
     Args:
         url: 크롤링할 URL
         screenshot_dir: 스크린샷 저장 경로
         auth_site: 인증에 사용할 사이트 이름 (저장된 쿠키 사용)
         cleanup_auth: 크롤링 후 인증 쿠키 자동 삭제 (기본: True)
+        capture_full_page: 전체 페이지 스크린샷도 저장
     """
-    async with SiteCrawler(headless=True, auth_site=auth_site) as crawler:
+    async with SiteCrawler(headless=True, auth_site=auth_site, capture_full_page=capture_full_page) as crawler:
         analysis = await crawler.analyze_page(url, screenshot_dir)
         result = {
             "analysis": asdict(analysis) if hasattr(analysis, '__dataclass_fields__') else analysis.__dict__,
@@ -428,29 +853,109 @@ async def crawl_site(url: str, screenshot_dir: Optional[str] = None, auth_site:
     if auth_site and cleanup_auth and AUTH_AVAILABLE:
         from auth_manager import delete_cookies
         delete_cookies(auth_site)
-        print(f"🧹 인증 쿠키 자동 삭제: {auth_site}")
+        logger.info("🧹 인증 쿠키 자동 삭제: %s", auth_site)
 
     return result
 
 
-def crawl_site_sync(url: str, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True) -> dict:
+async def crawl_sites(urls: list, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True, concurrency: int = 4, capture_full_page: bool = False) -> list:
+    """
+    여러 URL 동시 크롤링 (브라우저/컨텍스트 1개 공유)
+
+    async 호출자는 끝날 때 SiteCrawler.shutdown() 호출 (또는 browser_session() 안에서 호출)
+
+    Args:
+        urls: 크롤링할 URL 목록
+        screenshot_dir: 스크린샷 저장 경로
+        auth_site: 인증에 사용할 사이트 이름 (저장된 쿠키 사용)
+        cleanup_auth: 크롤링 후 인증 쿠키 자동 삭제 (기본: True)
+        concurrency: 동시에 열 페이지 수
+        capture_full_page: 전체 페이지 스크린샷도 저장
+
+    Returns:
+        urls 순서대로 crawl_site와 같은 형태의 결과 목록
+    """
+    async with SiteCrawler(headless=True, auth_site=auth_site, capture_full_page=capture_full_page) as crawler:
+        analyses = await crawler.crawl_sites(urls, screenshot_dir, concurrency)
+        results = [
+            {
+                "analysis": asdict(analysis),
+                "markdown": crawler.to_markdown(analysis)
+            }
+            for analysis in analyses
+        ]
+
+    # 크롤링 완료 후 인증 쿠키 자동 삭제
+    if auth_site and cleanup_auth and AUTH_AVAILABLE:
+        from auth_manager import delete_cookies
+        delete_cookies(auth_site)
+        logger.info("🧹 인증 쿠키 자동 삭제: %s", auth_site)
+
+    return results
+
+
+def run_async(coro):
+    """asyncio.run 대체 (uvloop 설치 시 uvloop 루프에서 실행)"""
+    if UVLOOP_AVAILABLE:
+        if sys.version_info >= (3, 11):
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                return runner.run(coro)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
+@asynccontextmanager
+async def browser_session():
+    """
+    공유 브라우저를 쓰는 구간 (끝나면 SiteCrawler.shutdown())
+
+    Example:
+        async with browser_session():
+            result = await crawl_site("https://example.com")
+    """
+    try:
+        yield
+    finally:
+        await SiteCrawler.shutdown()
+
+
+async def _run_and_shutdown(coro):
+    """코루틴 실행 후 공유 브라우저 종료 (실행이 끝나면 루프와 함께 못 쓰게 되므로)"""
+    async with browser_session():
+        return await coro
+
+
+def crawl_site_sync(url: str, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True, capture_full_page: bool = False) -> dict:
+    """동기 버전 (CLI용)"""
+    return run_async(_run_and_shutdown(crawl_site(url, screenshot_dir, auth_site, cleanup_auth, capture_full_page)))
+
+
+def crawl_sites_sync(urls: list, screenshot_dir: Optional[str] = None, auth_site: Optional[str] = None, cleanup_auth: bool = True, concurrency: int = 4, capture_full_page: bool = False) -> list:
     """동기 버전 (CLI용)"""
-    return asyncio.run(crawl_site(url, screenshot_dir, auth_site, cleanup_auth))
+    return run_async(_run_and_shutdown(crawl_sites(urls, screenshot_dir, auth_site, cleanup_auth, concurrency, capture_full_page)))
 
 
 # CLI 인터페이스
 if __name__ == "__main__":
     import argparse
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="QA Sync Site Crawler")
     parser.add_argument("url", nargs="?", help="크롤링할 URL")
     parser.add_argument("screenshot_dir", nargs="?", help="스크린샷 저장 경로")
     parser.add_argument("--auth", "-a", help="인증에 사용할 사이트 이름")
     parser.add_argument("--login", "-l", help="로그인 후 쿠키 저장 (사이트 이름)")
     parser.add_argument("--list-auth", action="store_true", help="저장된 인증 목록")
+    parser.add_argument("--urls", nargs="+", default=[], help="함께 크롤링할 추가 URL")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="동시 크롤링 페이지 수 (기본: 4)")
+    parser.add_argument("--full-page", action="store_true", help="전체 페이지 스크린샷도 저장")
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+
     # 인증 목록 보기
     if args.list_auth:
         if AUTH_AVAILABLE:
@@ -494,6 +999,9 @@ if __name__ == "__main__":
         print("")
         print("  # 저장된 인증 목록")
         print("  python3 site_crawler.py --list-auth")
+        print("")
+        print("  # 여러 페이지 동시 크롤링")
+        print("  python3 site_crawler.py https://example.com ./screenshots --urls https://example.com/about --concurrency 4")
         sys.exit(1)
 
     if not PLAYWRIGHT_AVAILABLE:
@@ -501,18 +1009,24 @@ if __name__ == "__main__":
         print("Run: python3 src/install.py")
         sys.exit(1)
 
-    print(f"🔍 Crawling {args.url}...")
+    urls = [args.url] + args.urls
+
+    print(f"🔍 Crawling {', '.join(urls)}...")
     if args.auth:
         print(f"   인증: {args.auth}")
 
-    result = crawl_site_sync(args.url, args.screenshot_dir, args.auth)
+    if len(urls) > 1:
+        results = crawl_sites_sync(urls, args.screenshot_dir, args.auth, concurrency=args.concurrency, capture_full_page=args.full_page)
+    else:
+        results = [crawl_site_sync(args.url, args.screenshot_dir, args.auth, capture_full_page=args.full_page)]
 
-    print("\n" + "=" * 50)
-    print(result["markdown"])
+    for result in results:
+        print("\n" + "=" * 50)
+        print(result["markdown"])
 
     # JSON 출력
     if args.screenshot_dir:
         json_path = f"{args.screenshot_dir}/analysis.json"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(result["analysis"], f, ensure_ascii=False, indent=2)
+        analyses = [r["analysis"] for r in results]
+        Path(json_path).write_bytes(_dumps_pretty(analyses[0] if len(analyses) == 1 else analyses))
         print(f"\nJSON saved to: {json_path}")
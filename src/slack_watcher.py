@@ -6,7 +6,9 @@ QA Sync Slack Watcher
 - Claude Code MCP와 연동하여 Linear 이슈 생성
 """
 
+import asyncio
 import json
+import re
 import time
 import subprocess
 import sys
@@ -17,10 +19,22 @@ from typing import Optional, Callable
 # 상태 관리자 임포트
 sys.path.insert(0, str(Path(__file__).parent))
 from state_manager import (
-    load_state, get_project, is_message_synced,
-    mark_message_synced, list_projects
+    load_state, get_project, get_synced_ts_set,
+    mark_message_synced, mark_messages_synced_batch, list_projects
 )
 
+# 키워드 기반 분류 (타입별로 미리 컴파일해 메시지당 한 번씩만 스캔)
+BUG_KEYWORDS = ["안 됨", "에러", "깨짐", "오류", "버그", "안됨", "작동", "실패", "crash"]
+DATA_KEYWORDS = ["틀림", "안 맞", "중복", "잘못", "데이터", "값이", "표시"]
+IMPROVEMENT_KEYWORDS = ["좋겠", "개선", "추가", "제안", "하면", "있으면"]
+
+_BUG_RE = re.compile("|".join(map(re.escape, BUG_KEYWORDS)))
+_DATA_RE = re.compile("|".join(map(re.escape, DATA_KEYWORDS)))
+_IMPROVEMENT_RE = re.compile("|".join(map(re.escape, IMPROVEMENT_KEYWORDS)))
+
+# 새 메시지가 없을 때 폴링 간격을 늘리는 최대 배수
+MAX_BACKOFF_FACTOR = 8
+
 
 class SlackWatcher:
     """Slack 채널 모니터링"""
@@ -33,6 +47,7 @@ class SlackWatcher:
         """
         self.project_name = project_name
         self.poll_interval = poll_interval
+        self._current_interval = poll_interval
         self.project = get_project(project_name)
 
         if not self.project:
@@ -57,27 +72,24 @@ class SlackWatcher:
 
     def filter_unsynced(self, messages: list) -> list:
         """이미 처리된 메시지 필터링"""
-        return [
-            msg for msg in messages
-            if not is_message_synced(self.project_name, msg.get("ts", ""))
-        ]
+        if not messages:
+            return []
+
+        # 상태는 한 번만 읽고 집합으로 확인
+        synced = get_synced_ts_set(self.project_name)
+        return [msg for msg in messages if msg.get("ts", "") not in synced]
 
     def analyze_message(self, message: dict) -> dict:
         """메시지 분석하여 이슈 타입 결정"""
         text = message.get("text", "").lower()
 
-        # 키워드 기반 분류
-        bug_keywords = ["안 됨", "에러", "깨짐", "오류", "버그", "안됨", "작동", "실패", "crash"]
-        data_keywords = ["틀림", "안 맞", "중복", "잘못", "데이터", "값이", "표시"]
-        improvement_keywords = ["좋겠", "개선", "추가", "제안", "하면", "있으면"]
-
         issue_type = "bug"  # default
 
-        if any(kw in text for kw in improvement_keywords):
+        if _IMPROVEMENT_RE.search(text):
             issue_type = "improvement"
-        elif any(kw in text for kw in data_keywords):
+        elif _DATA_RE.search(text):
             issue_type = "data_error"
-        elif any(kw in text for kw in bug_keywords):
+        elif _BUG_RE.search(text):
             issue_type = "bug"
 
         # 제목 생성 (30자 이내)
@@ -115,25 +127,80 @@ Slack message ts: {analysis.get('ts', '')}
         # Placeholder: 실제 issue_id 반환
         return f"ISSUE-{int(time.time())}"
 
-    def process_message(self, message: dict) -> bool:
-        """메시지 처리 (분석 → 이슈 생성 → 상태 저장)"""
+    def _handle_message(self, message: dict) -> Optional[tuple]:
+        """메시지 분석 → 이슈 생성 (성공 시 상태에 기록할 (ts, issue_id, type) 반환)"""
         try:
             analysis = self.analyze_message(message)
             issue_id = self.create_linear_issue(analysis)
 
             if issue_id:
-                mark_message_synced(
-                    self.project_name,
-                    message.get("ts", ""),
-                    issue_id,
-                    analysis["type"]
-                )
-                return True
+                return (message.get("ts", ""), issue_id, analysis["type"])
         except Exception as e:
             print(f"Error processing message: {e}")
 
+        return None
+
+    def process_message(self, message: dict) -> bool:
+        """메시지 처리 (분석 → 이슈 생성 → 상태 저장)"""
+        entry = self._handle_message(message)
+        if entry:
+            mark_message_synced(self.project_name, *entry)
+            return True
         return False
 
+    def poll_once(self, callback: Optional[Callable] = None) -> list:
+        """한 번 폴링하여 새 메시지 처리 (처리한 메시지 목록 반환)"""
+        messages = self.get_new_messages()
+        unsynced = self.filter_unsynced(messages)
+
+        if unsynced:
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Found {len(unsynced)} new messages")
+            entries = [self._handle_message(msg) for msg in unsynced]
+            self._finish_poll(unsynced, entries, callback)
+
+        return unsynced
+
+    async def poll_once_async(self, callback: Optional[Callable] = None) -> list:
+        """poll_once의 asyncio 버전 (메시지별 이슈 생성을 동시에 실행)"""
+        messages = self.get_new_messages()
+        unsynced = self.filter_unsynced(messages)
+
+        if unsynced:
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Found {len(unsynced)} new messages")
+            loop = asyncio.get_running_loop()
+            entries = await asyncio.gather(*(
+                loop.run_in_executor(None, self._handle_message, msg) for msg in unsynced
+            ))
+            self._finish_poll(unsynced, entries, callback)
+
+        return unsynced
+
+    def _finish_poll(self, unsynced: list, entries: list, callback: Optional[Callable]):
+        """처리 결과 출력 후 상태는 폴링당 한 번만 저장"""
+        for msg, entry in zip(unsynced, entries):
+            status = "✅" if entry else "❌"
+            print(f"  {status} {msg.get('ts', '')}")
+
+        mark_messages_synced_batch(self.project_name, [entry for entry in entries if entry])
+
+        if callback:
+            callback(unsynced)
+
+    def _next_interval(self, had_messages: bool) -> int:
+        """다음 폴링 간격 (새 메시지 없으면 두 배씩 늘리고, 있으면 초기화)"""
+        if had_messages:
+            self._current_interval = self.poll_interval
+        else:
+            self._current_interval = min(self._current_interval * 2, self.poll_interval * MAX_BACKOFF_FACTOR)
+        return self._current_interval
+
+    def _print_header(self):
+        print(f"🔍 Watching Slack channel for project: {self.project_name}")
+        print(f"   Channel: {self.channel}")
+        print(f"   Thread: {self.thread_ts or '(entire channel)'}")
+        print(f"   Poll interval: {self.poll_interval}s (max {self.poll_interval * MAX_BACKOFF_FACTOR}s when idle)")
+        print("-" * 50)
+
     def watch(self, callback: Optional[Callable] = None, max_iterations: Optional[int] = None):
         """
         메시지 감시 시작
@@ -142,31 +209,15 @@ Slack message ts: {analysis.get('ts', '')}
             callback: 새 메시지 감지 시 호출할 콜백
             max_iterations: 최대 반복 횟수 (None이면 무한)
         """
-        print(f"🔍 Watching Slack channel for project: {self.project_name}")
-        print(f"   Channel: {self.channel}")
-        print(f"   Thread: {self.thread_ts or '(entire channel)'}")
-        print(f"   Poll interval: {self.poll_interval}s")
-        print("-" * 50)
+        self._print_header()
+        self._current_interval = self.poll_interval
 
         iteration = 0
 
         while max_iterations is None or iteration < max_iterations:
             try:
-                messages = self.get_new_messages()
-                unsynced = self.filter_unsynced(messages)
-
-                if unsynced:
-                    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Found {len(unsynced)} new messages")
-
-                    for msg in unsynced:
-                        success = self.process_message(msg)
-                        status = "✅" if success else "❌"
-                        print(f"  {status} {msg.get('ts', '')}")
-
-                    if callback:
-                        callback(unsynced)
-
-                time.sleep(self.poll_interval)
+                unsynced = self.poll_once(callback)
+                time.sleep(self._next_interval(bool(unsynced)))
                 iteration += 1
 
             except KeyboardInterrupt:
@@ -176,6 +227,30 @@ Slack message ts: {analysis.get('ts', '')}
                 print(f"Error: {e}")
                 time.sleep(self.poll_interval)
 
+    async def watch_async(self, callback: Optional[Callable] = None, max_iterations: Optional[int] = None):
+        """
+        메시지 감시 (asyncio 버전, 여러 프로젝트를 한 프로세스에서 감시할 때)
+
+        Args:
+            callback: 새 메시지 감지 시 호출할 콜백
+            max_iterations: 최대 반복 횟수 (None이면 무한)
+        """
+        self._print_header()
+        self._current_interval = self.poll_interval
+
+        iteration = 0
+
+        while max_iterations is None or iteration < max_iterations:
+            try:
+                # 이슈 생성만 스레드에서 동시에, 상태 파일 읽기/쓰기는 이벤트 루프에서
+                unsynced = await self.poll_once_async(callback)
+                await asyncio.sleep(self._next_interval(bool(unsynced)))
+                iteration += 1
+
+            except Exception as e:
+                print(f"Error: {e}")
+                await asyncio.sleep(self.poll_interval)
+
 
 def watch_project(project_name: str, interval: int = 30):
     """프로젝트 감시 시작"""
@@ -183,6 +258,12 @@ def watch_project(project_name: str, interval: int = 30):
     watcher.watch()
 
 
+async def watch_all(project_names: list, interval: int = 30, callback: Optional[Callable] = None):
+    """여러 프로젝트 동시 감시"""
+    watchers = [SlackWatcher(name, poll_interval=interval) for name in project_names]
+    await asyncio.gather(*(watcher.watch_async(callback) for watcher in watchers))
+
+
 def notify_new_messages(messages: list):
     """macOS 알림 표시"""
     count = len(messages)
@@ -204,6 +285,7 @@ if __name__ == "__main__":
         print("")
         print("Commands:")
         print("  watch <project_name> [interval]  - Start watching (default: 30s)")
+        print("  watch-all <project_name>...      - Watch several projects at once")
         print("  list                             - List available projects")
         print("  status <project_name>            - Show project sync status")
         print("")
@@ -234,13 +316,22 @@ if __name__ == "__main__":
             print(f"Error: {e}")
             sys.exit(1)
 
+    elif cmd == "watch-all" and len(sys.argv) > 2:
+        try:
+            asyncio.run(watch_all(sys.argv[2:]))
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\n\n👋 Watcher stopped")
+
     elif cmd == "status" and len(sys.argv) > 2:
         project_name = sys.argv[2]
         project = get_project(project_name)
 
         if project:
             stats = project.get("stats", {})
-            synced = len(project.get("synced_messages", []))
+            synced = len(get_synced_ts_set(project_name))
 
             print(f"Project: {project_name}")
             print(f"  Channel: {project['config'].get('slack_channel', 'N/A')}")
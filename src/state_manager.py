@@ -6,16 +6,35 @@ QA Sync State Manager
 - 시나리오 완료 상태 관리
 """
 
+import copy
 import json
 import os
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# orjson이 있으면 사용 (없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 기본 저장 경로
 DEFAULT_STATE_DIR = Path.home() / ".qa-sync"
 DEFAULT_STATE_FILE = DEFAULT_STATE_DIR / "state.json"
 
+# load_state 캐시 (상태 파일 inode/mtime/크기가 같으면 다시 파싱하지 않음)
+_STATE_CACHE = {"key": None, "value": None}
+
+# 프로젝트별 처리된 메시지 ts 집합 (로그 파일 mtime/크기가 같으면 다시 읽지 않음)
+_SYNCED_INDEX = {}
+
+# state_session 동안 공유하는 현재 시각 (세션 밖이면 None)
+_SESSION_NOW = {"value": None}
+
 
 def get_state_path(project_name: Optional[str] = None) -> Path:
     """프로젝트별 상태 파일 경로 반환"""
@@ -24,12 +43,23 @@ def get_state_path(project_name: Optional[str] = None) -> Path:
     return DEFAULT_STATE_FILE
 
 
+def get_synced_log_path(project_name: str) -> Path:
+    """프로젝트별 처리된 메시지 로그 경로 (한 줄에 ts 하나, 추가만 함)"""
+    return DEFAULT_STATE_DIR / f"{project_name}.synced"
+
+
+def _now_iso() -> str:
+    """현재 시각 ISO 문자열 (state_session 안에서는 세션 시작 시각 재사용)"""
+    return _SESSION_NOW["value"] or datetime.now().isoformat()
+
+
 def init_state() -> dict:
     """빈 상태 초기화"""
+    now = _now_iso()
     return {
         "version": "1.0.0",
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
+        "created_at": now,
+        "updated_at": now,
         "projects": {}
     }
 
@@ -38,7 +68,7 @@ def init_project(name: str) -> dict:
     """프로젝트 초기 상태"""
     return {
         "name": name,
-        "created_at": datetime.now().isoformat(),
+        "created_at": _now_iso(),
         "config": {
             "site_url": None,
             "prd_path": None,
@@ -48,8 +78,7 @@ def init_project(name: str) -> dict:
             "linear_project_url": None
         },
         "scenarios": [],
-        "synced_messages": [],  # 이미 처리한 Slack 메시지 ts
-        "issues_created": [],   # 생성한 Linear 이슈 ID
+        "issues_created": [],   # 생성한 Linear 이슈 ID (처리한 Slack 메시지 ts는 <project>.synced)
         "stats": {
             "total_scenarios": 0,
             "completed_scenarios": 0,
@@ -61,35 +90,176 @@ def init_project(name: str) -> dict:
     }
 
 
+def _dumps(data: dict) -> bytes:
+    """JSON 직렬화 (들여쓰기 2칸, UTF-8 bytes)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """JSON 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _file_key(path: Path) -> Optional[tuple]:
+    """파일 변경 감지 키 (없으면 None, os.replace로 교체되면 inode가 바뀜)"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_state() -> dict:
-    """상태 파일 로드"""
-    DEFAULT_STATE_DIR.mkdir(parents=True, exist_ok=True)
+    """
+    상태 파일 로드 (파일이 바뀌지 않았으면 메모리 캐시 반환)
 
-    if DEFAULT_STATE_FILE.exists():
-        with open(DEFAULT_STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+    반환된 dict는 캐시와 공유하므로 state_session/변경 함수(_state=) 밖에서 수정하면 안 됨.
+    조회만 할 때는 복사본을 주는 get_project/get_project_stats 사용
+    """
+    key = _file_key(DEFAULT_STATE_FILE)
+    if key is None:
+        return init_state()
 
-    return init_state()
+    if _STATE_CACHE["key"] == key:
+        return _STATE_CACHE["value"]
+
+    with open(DEFAULT_STATE_FILE, "rb") as f:
+        state = _loads(f.read())
+
+    _STATE_CACHE["key"] = key
+    _STATE_CACHE["value"] = state
+    return state
 
 
 def save_state(state: dict) -> None:
     """상태 파일 저장"""
     DEFAULT_STATE_DIR.mkdir(parents=True, exist_ok=True)
-    state["updated_at"] = datetime.now().isoformat()
+    state["updated_at"] = _now_iso()
+
+    # 이전 버전 synced_messages 목록은 저장 전에 로그로 옮김 (상태 파일에 다시 쓰지 않음)
+    for project_name, project in state["projects"].items():
+        if "synced_messages" in project:
+            _migrate_synced_messages(state, project_name)
+
+    # 프로세스마다 다른 임시 파일에 쓰고 교체 (저장 중 중단되거나 동시에 저장해도 기존 파일은 온전)
+    data = _dumps(state)
+    with tempfile.NamedTemporaryFile(dir=DEFAULT_STATE_DIR, prefix="state.", suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.replace(tmp_path, DEFAULT_STATE_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    # 방금 쓴 내용을 캐시로 (다음 load_state는 파싱 없이 반환)
+    _STATE_CACHE["key"] = _file_key(DEFAULT_STATE_FILE)
+    _STATE_CACHE["value"] = state
+
+
+def _log_synced_set(project_name: str) -> set:
+    """처리된 메시지 로그의 ts 집합 (로그 파일 mtime/크기가 바뀌면 다시 읽음)"""
+    path = get_synced_log_path(project_name)
+    key = _file_key(path)
+    entry = _SYNCED_INDEX.get(project_name)
+
+    if entry is None or entry["key"] != key:
+        synced = set()
+        if key is not None:
+            with open(path, encoding="utf-8") as f:
+                synced = set(f.read().splitlines())
+        entry = {"key": key, "set": synced}
+        _SYNCED_INDEX[project_name] = entry
+
+    return entry["set"]
+
+
+def _append_synced_log(project_name: str, message_ts_list: list) -> None:
+    """처리된 메시지 ts를 로그 끝에 추가 (상태 파일 전체를 다시 쓰지 않음)"""
+    path = get_synced_log_path(project_name)
+    DEFAULT_STATE_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(DEFAULT_STATE_FILE, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    before = _file_key(path)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(f"{ts}\n" for ts in message_ts_list))
 
+    # 그 사이 다른 프로세스가 쓰지 않았으면 인덱스도 갱신 (아니면 다음 조회 때 다시 읽음)
+    entry = _SYNCED_INDEX.get(project_name)
+    if entry is not None and entry["key"] == before:
+        entry["set"].update(message_ts_list)
+        entry["key"] = _file_key(path)
 
-def get_project(project_name: str) -> Optional[dict]:
-    """프로젝트 상태 조회"""
+
+def _migrate_synced_messages(state: dict, project_name: str) -> None:
+    """이전 버전 상태의 synced_messages 목록을 로그로 합치고 상태에서 제거 (쓰기 경로에서만 호출)"""
+    legacy = state["projects"][project_name].pop("synced_messages", None)
+    if not legacy:
+        return
+
+    synced = _log_synced_set(project_name)
+    missing = [ts for ts in dict.fromkeys(legacy) if ts not in synced]
+    if missing:
+        _append_synced_log(project_name, missing)
+
+
+def _synced_set(state: dict, project_name: str) -> set:
+    """
+    프로젝트의 처리된 메시지 ts 집합
+
+    내부 인덱스를 그대로 반환하므로 호출자는 수정하면 안 됨.
+    아직 로그로 옮기지 않은 이전 버전 목록이 있으면 합친 새 집합 반환 (상태는 바꾸지 않음)
+    """
+    synced = _log_synced_set(project_name)
+    legacy = state["projects"][project_name].get("synced_messages")
+    return synced.union(legacy) if legacy else synced
+
+
+@contextmanager
+def state_session():
+    """
+    상태를 한 번 로드해 여러 변경에 공유하고 끝날 때 한 번만 저장
+
+    Example:
+        with state_session() as state:
+            add_scenarios(name, scenarios, _state=state)
+            mark_scenario_completed(name, 0, _state=state)
+    """
     state = load_state()
-    return state["projects"].get(project_name)
+    prev_now = _SESSION_NOW["value"]
+    _SESSION_NOW["value"] = prev_now or datetime.now().isoformat()
+    try:
+        yield state
+    except BaseException:
+        # 저장하지 않은 변경이 캐시에 남지 않도록
+        _STATE_CACHE["key"] = None
+        raise
+    else:
+        save_state(state)
+    finally:
+        _SESSION_NOW["value"] = prev_now
 
 
-def create_project(project_name: str, config: dict) -> dict:
-    """새 프로젝트 생성"""
+def get_project(project_name: str) -> Optional[dict]:
+    """프로젝트 상태 조회 (복사본이라 수정해도 상태/캐시에 반영 안 됨)"""
     state = load_state()
+    project = state["projects"].get(project_name)
+    return copy.deepcopy(project) if project is not None else None
+
+
+def create_project(project_name: str, config: dict, _state: Optional[dict] = None) -> dict:
+    """새 프로젝트 생성 (반환값은 복사본)"""
+    state = load_state() if _state is None else _state
 
     if project_name in state["projects"]:
         # 기존 프로젝트 업데이트
@@ -100,25 +270,27 @@ def create_project(project_name: str, config: dict) -> dict:
         project["config"].update(config)
         state["projects"][project_name] = project
 
-    save_state(state)
-    return state["projects"][project_name]
+    if _state is None:
+        save_state(state)
+    return copy.deepcopy(state["projects"][project_name])
 
 
-def update_project_config(project_name: str, config: dict) -> dict:
-    """프로젝트 설정 업데이트"""
-    state = load_state()
+def update_project_config(project_name: str, config: dict, _state: Optional[dict] = None) -> dict:
+    """프로젝트 설정 업데이트 (반환값은 복사본)"""
+    state = load_state() if _state is None else _state
 
     if project_name not in state["projects"]:
-        return create_project(project_name, config)
+        return create_project(project_name, config, _state=_state)
 
     state["projects"][project_name]["config"].update(config)
-    save_state(state)
-    return state["projects"][project_name]
+    if _state is None:
+        save_state(state)
+    return copy.deepcopy(state["projects"][project_name])
 
 
-def add_scenarios(project_name: str, scenarios: list) -> None:
+def add_scenarios(project_name: str, scenarios: list, _state: Optional[dict] = None) -> None:
     """시나리오 추가"""
-    state = load_state()
+    state = load_state() if _state is None else _state
 
     if project_name not in state["projects"]:
         state["projects"][project_name] = init_project(project_name)
@@ -127,22 +299,25 @@ def add_scenarios(project_name: str, scenarios: list) -> None:
     project["scenarios"].extend(scenarios)
     project["stats"]["total_scenarios"] = len(project["scenarios"])
 
-    save_state(state)
+    if _state is None:
+        save_state(state)
 
 
-def mark_scenario_completed(project_name: str, scenario_id: int) -> None:
+def mark_scenario_completed(project_name: str, scenario_id: int, _state: Optional[dict] = None) -> None:
     """시나리오 완료 표시"""
-    state = load_state()
+    state = load_state() if _state is None else _state
 
     if project_name in state["projects"]:
         project = state["projects"][project_name]
         if 0 <= scenario_id < len(project["scenarios"]):
-            project["scenarios"][scenario_id]["completed"] = True
-            project["scenarios"][scenario_id]["completed_at"] = datetime.now().isoformat()
-            project["stats"]["completed_scenarios"] = sum(
-                1 for s in project["scenarios"] if s.get("completed", False)
-            )
-            save_state(state)
+            scenario = project["scenarios"][scenario_id]
+            # 미완료 → 완료로 바뀔 때만 카운트 증가 (이미 완료면 그대로)
+            if not scenario.get("completed", False):
+                scenario["completed"] = True
+                scenario["completed_at"] = _now_iso()
+                project["stats"]["completed_scenarios"] += 1
+                if _state is None:
+                    save_state(state)
 
 
 def is_message_synced(project_name: str, message_ts: str) -> bool:
@@ -150,39 +325,75 @@ def is_message_synced(project_name: str, message_ts: str) -> bool:
     state = load_state()
 
     if project_name in state["projects"]:
-        return message_ts in state["projects"][project_name]["synced_messages"]
+        return message_ts in _synced_set(state, project_name)
     return False
 
 
-def mark_message_synced(project_name: str, message_ts: str, issue_id: str, issue_type: str) -> None:
-    """메시지 처리 완료 표시"""
+def get_synced_ts_set(project_name: str) -> set:
+    """처리된 메시지 ts 집합 (여러 메시지를 한 번에 확인할 때, 내부 인덱스이므로 수정 금지)"""
     state = load_state()
 
-    if project_name not in state["projects"]:
-        state["projects"][project_name] = init_project(project_name)
+    if project_name in state["projects"]:
+        return _synced_set(state, project_name)
+    return set()
+
+
+def mark_message_synced(project_name: str, message_ts: str, issue_id: str, issue_type: str, _state: Optional[dict] = None) -> None:
+    """메시지 처리 완료 표시"""
+    mark_messages_synced_batch(project_name, [(message_ts, issue_id, issue_type)], _state=_state)
 
-    project = state["projects"][project_name]
 
-    if message_ts not in project["synced_messages"]:
-        project["synced_messages"].append(message_ts)
+def mark_messages_synced_batch(project_name: str, entries: list, _state: Optional[dict] = None) -> None:
+    """
+    여러 메시지 처리 완료를 한 번에 표시 (상태 파일은 한 번만 저장)
 
-    project["issues_created"].append({
-        "issue_id": issue_id,
-        "message_ts": message_ts,
-        "issue_type": issue_type,
-        "created_at": datetime.now().isoformat()
-    })
+    Args:
+        project_name: 프로젝트 이름
+        entries: (message_ts, issue_id, issue_type) 튜플 목록
+        _state: state_session 안에서 호출 시 세션 상태 (저장은 세션이 담당)
+    """
+    if not entries:
+        return
 
-    # 통계 업데이트
-    project["stats"]["total_issues"] += 1
-    if issue_type == "bug":
-        project["stats"]["bugs"] += 1
-    elif issue_type == "improvement":
-        project["stats"]["improvements"] += 1
-    elif issue_type == "data_error":
-        project["stats"]["data_errors"] += 1
+    state = load_state() if _state is None else _state
 
-    save_state(state)
+    if project_name not in state["projects"]:
+        state["projects"][project_name] = init_project(project_name)
+
+    _migrate_synced_messages(state, project_name)
+
+    project = state["projects"][project_name]
+    synced = _synced_set(state, project_name)
+    stats = project["stats"]
+    now = _now_iso()
+    new_ts = {}  # 배치 안 중복도 한 번만 (순서 유지)
+
+    for message_ts, issue_id, issue_type in entries:
+        if message_ts not in synced:
+            new_ts[message_ts] = None
+
+        project["issues_created"].append({
+            "issue_id": issue_id,
+            "message_ts": message_ts,
+            "issue_type": issue_type,
+            "created_at": now
+        })
+
+        # 통계 업데이트
+        stats["total_issues"] += 1
+        if issue_type == "bug":
+            stats["bugs"] += 1
+        elif issue_type == "improvement":
+            stats["improvements"] += 1
+        elif issue_type == "data_error":
+            stats["data_errors"] += 1
+
+    # 로그는 바로 추가 (이슈는 이미 만들어졌으므로 세션이 실패해도 다시 처리하지 않도록)
+    if new_ts:
+        _append_synced_log(project_name, list(new_ts))
+
+    if _state is None:
+        save_state(state)
 
 
 def get_project_stats(project_name: str) -> dict:
@@ -190,7 +401,7 @@ def get_project_stats(project_name: str) -> dict:
     state = load_state()
 
     if project_name in state["projects"]:
-        return state["projects"][project_name]["stats"]
+        return dict(state["projects"][project_name]["stats"])
     return {}
 
 
@@ -205,8 +416,8 @@ def get_unsynced_count(project_name: str, all_message_ts: list) -> int:
     state = load_state()
 
     if project_name in state["projects"]:
-        synced = set(state["projects"][project_name]["synced_messages"])
-        return len([ts for ts in all_message_ts if ts not in synced])
+        synced = _synced_set(state, project_name)
+        return sum(1 for ts in all_message_ts if ts not in synced)
     return len(all_message_ts)
 
 
@@ -6,28 +6,28 @@ QA Sync 테스트 자동화 실행기
 - 스크린샷 캡처
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import os
 import re
-from dataclasses import dataclass, field, asdict
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Any
 from enum import Enum
 
-try:
-    from playwright.async_api import async_playwright, Page, Browser, BrowserContext
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Playwright/인증 모듈은 브라우저를 띄울 때만 임포트 (시나리오 파싱만 할 때는 불필요)
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Browser, BrowserContext
 
-# 인증 모듈
-try:
-    from auth_manager import load_cookies
-    AUTH_AVAILABLE = True
-except ImportError:
-    AUTH_AVAILABLE = False
+# 시나리오 파싱용 정규식
+_STEP_RE = re.compile(r'(\d+)\.\s*([^0-9]+?)(?=\d+\.|$)')  # "1. xxx 2. xxx"
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_BUTTON_RE = re.compile(r'([\w가-힣]+)\s*(버튼|링크|탭|메뉴)')
+_URL_RE = re.compile(r'https?://[^\s]+')
 
 
 class TestStatus(Enum):
@@ -37,6 +37,14 @@ class TestStatus(Enum):
     ERROR = "error"
 
 
+_STATUS_EMOJI = {
+    TestStatus.PASSED: "✅",
+    TestStatus.FAILED: "❌",
+    TestStatus.SKIPPED: "⏭️",
+    TestStatus.ERROR: "💥"
+}
+
+
 @dataclass
 class TestStep:
     """테스트 단계"""
@@ -85,17 +93,73 @@ class TestReport:
     results: List[TestResult] = field(default_factory=list)
 
 
+class _PagePool:
+    """테스트 간 재사용하는 페이지 풀 (최대 size개 유지)"""
+
+    def __init__(self, context: BrowserContext, size: int):
+        self.context = context
+        self.size = size
+        self._idle: List[Page] = []
+
+    async def acquire(self) -> Page:
+        if self._idle:
+            return self._idle.pop()
+        return await self.context.new_page()
+
+    async def release(self, page: Page):
+        # 빈 페이지로 돌려 이전 테스트의 스크립트/타이머 정리 (실패하거나 넘치면 닫음)
+        if len(self._idle) < self.size:
+            try:
+                await page.goto("about:blank")
+                self._idle.append(page)
+                return
+            except Exception:
+                pass
+        await page.close()
+
+    async def close(self):
+        for page in self._idle:
+            await page.close()
+        self._idle.clear()
+
+
 class TestRunner:
     """QA 테스트 자동 실행기"""
 
-    def __init__(self, headless: bool = True, auth_site: Optional[str] = None):
+    def __init__(self, headless: bool = True, auth_site: Optional[str] = None, capture_on_success: bool = False):
+        """
+        Args:
+            headless: 브라우저 숨김 모드
+            auth_site: 인증에 사용할 사이트 이름 (저장된 인증 상태 사용)
+            capture_on_success: 성공한 테스트도 스크린샷 저장 (실패/에러는 항상 저장)
+        """
         self.headless = headless
         self.auth_site = auth_site
+        self.capture_on_success = capture_on_success
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
+        # 액션 이름 → 실행 메서드
+        self._actions = {
+            "navigate": self._navigate,
+            "click": self._click,
+            "fill": self._fill,
+            "select": self._select,
+            "check": self._check,
+            "uncheck": self._uncheck,
+            "hover": self._hover,
+            "press": self._press,
+            "wait": self._wait,
+            "wait_for": self._wait_for,
+            "assert_visible": self._assert_visible,
+            "assert_text": self._assert_text,
+            "assert_url": self._assert_url,
+            "assert_not_visible": self._assert_not_visible,
+            "screenshot": self._screenshot
+        }
+
     async def __aenter__(self):
         await self.start()
         return self
@@ -105,22 +169,30 @@ class TestRunner:
 
     async def start(self):
         """브라우저 시작"""
-        if not PLAYWRIGHT_AVAILABLE:
-            raise RuntimeError("Playwright가 설치되지 않았습니다. python3 src/install.py 실행")
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise RuntimeError("Playwright가 설치되지 않았습니다. python3 src/install.py 실행") from None
 
         self.playwright = await async_playwright().start()
         self.browser = await self.playwright.chromium.launch(headless=self.headless)
+
+        # 인증 상태 (쿠키 + localStorage) 적용
+        storage_state = None
+        if self.auth_site:
+            try:
+                from auth_manager import get_storage_state_path
+                storage_state = get_storage_state_path(self.auth_site)
+            except ImportError:
+                pass
+            if storage_state:
+                print(f"✅ 인증 상태 적용: {self.auth_site}")
+
         self.context = await self.browser.new_context(
-            viewport={"width": 1280, "height": 720}
+            viewport={"width": 1280, "height": 720},
+            storage_state=str(storage_state) if storage_state else None
         )
 
-        # 인증 쿠키 적용
-        if self.auth_site and AUTH_AVAILABLE:
-            cookies = load_cookies(self.auth_site)
-            if cookies:
-                await self.context.add_cookies(cookies)
-                print(f"✅ 인증 쿠키 적용: {self.auth_site}")
-
         self.page = await self.context.new_page()
 
     async def stop(self):
@@ -130,83 +202,95 @@ class TestRunner:
         if self.playwright:
             await self.playwright.stop()
 
-    async def run_step(self, step: TestStep) -> bool:
-        """단일 스텝 실행"""
-        try:
-            if step.action == "navigate":
-                await self.page.goto(step.target, wait_until="load", timeout=30000)
-                await self.page.wait_for_timeout(1000)
-
-            elif step.action == "click":
-                await self.page.click(step.target, timeout=10000)
-                await self.page.wait_for_timeout(500)
-
-            elif step.action == "fill":
-                await self.page.fill(step.target, step.value or "")
-
-            elif step.action == "select":
-                await self.page.select_option(step.target, step.value)
-
-            elif step.action == "check":
-                await self.page.check(step.target)
-
-            elif step.action == "uncheck":
-                await self.page.uncheck(step.target)
-
-            elif step.action == "hover":
-                await self.page.hover(step.target)
-                await self.page.wait_for_timeout(300)
-
-            elif step.action == "press":
-                await self.page.press(step.target or "body", step.value or "Enter")
-
-            elif step.action == "wait":
-                timeout = int(step.value) if step.value else 1000
-                await self.page.wait_for_timeout(timeout)
-
-            elif step.action == "wait_for":
-                await self.page.wait_for_selector(step.target, timeout=10000)
-
-            elif step.action == "assert_visible":
-                element = await self.page.query_selector(step.target)
-                if not element:
-                    return False
-                is_visible = await element.is_visible()
-                return is_visible
-
-            elif step.action == "assert_text":
-                element = await self.page.query_selector(step.target)
-                if not element:
-                    return False
-                text = await element.inner_text()
-                return step.value in text if step.value else bool(text)
-
-            elif step.action == "assert_url":
-                current_url = self.page.url
-                return step.value in current_url if step.value else True
-
-            elif step.action == "assert_not_visible":
-                element = await self.page.query_selector(step.target)
-                if not element:
-                    return True
-                is_visible = await element.is_visible()
-                return not is_visible
-
-            elif step.action == "screenshot":
-                await self.page.screenshot(path=step.target or "screenshot.png")
-
-            else:
-                print(f"⚠️ 알 수 없는 액션: {step.action}")
-                return True
-
+    async def run_step(self, step: TestStep, page: Optional[Page] = None) -> bool:
+        """단일 스텝 실행 (page 생략 시 기본 페이지)"""
+        handler = self._actions.get(step.action)
+        if handler is None:
+            print(f"⚠️ 알 수 없는 액션: {step.action}")
             return True
 
+        try:
+            return await handler(page or self.page, step)
         except Exception as e:
             print(f"❌ 스텝 실패 [{step.action}]: {e}")
             return False
 
-    async def run_test(self, test: TestCase, screenshot_dir: str) -> TestResult:
-        """단일 테스트 케이스 실행"""
+    # 액션별 실행 (성공 여부 반환)
+    async def _navigate(self, page: Page, step: TestStep) -> bool:
+        # DOM 준비 후 네트워크 안정은 짧게만 기다림 (고정 대기 대신)
+        await page.goto(step.target, wait_until="domcontentloaded", timeout=30000)
+        try:
+            await page.wait_for_load_state("networkidle", timeout=3000)
+        except Exception:
+            pass  # 폴링/웹소켓이 계속되는 페이지는 그대로 진행
+        return True
+
+    async def _click(self, page: Page, step: TestStep) -> bool:
+        # 고정 대기 없음: 다음 액션은 Playwright 자동 대기, assert 스텝은 각자 조건으로 대기
+        await page.click(step.target, timeout=10000)
+        return True
+
+    async def _fill(self, page: Page, step: TestStep) -> bool:
+        await page.fill(step.target, step.value or "")
+        return True
+
+    async def _select(self, page: Page, step: TestStep) -> bool:
+        await page.select_option(step.target, step.value)
+        return True
+
+    async def _check(self, page: Page, step: TestStep) -> bool:
+        await page.check(step.target)
+        return True
+
+    async def _uncheck(self, page: Page, step: TestStep) -> bool:
+        await page.uncheck(step.target)
+        return True
+
+    async def _hover(self, page: Page, step: TestStep) -> bool:
+        await page.hover(step.target)
+        return True
+
+    async def _press(self, page: Page, step: TestStep) -> bool:
+        await page.press(step.target or "body", step.value or "Enter")
+        return True
+
+    async def _wait(self, page: Page, step: TestStep) -> bool:
+        timeout = int(step.value) if step.value else 1000
+        await page.wait_for_timeout(timeout)
+        return True
+
+    async def _wait_for(self, page: Page, step: TestStep) -> bool:
+        await page.wait_for_selector(step.target, timeout=10000)
+        return True
+
+    # assert 스텝은 직전 액션의 결과(렌더링/이동)가 반영될 때까지 조건으로 대기 (시간 초과 시 실패)
+    async def _assert_visible(self, page: Page, step: TestStep) -> bool:
+        await page.wait_for_selector(step.target, state="visible", timeout=10000)
+        return True
+
+    async def _assert_text(self, page: Page, step: TestStep) -> bool:
+        if step.value:
+            await page.locator(step.target, has_text=step.value).first.wait_for(state="visible", timeout=10000)
+            return True
+        element = await page.wait_for_selector(step.target, state="visible", timeout=10000)
+        return bool(await element.inner_text())
+
+    async def _assert_url(self, page: Page, step: TestStep) -> bool:
+        if step.value:
+            await page.wait_for_url(lambda url: step.value in url, wait_until="commit", timeout=10000)
+        return True
+
+    async def _assert_not_visible(self, page: Page, step: TestStep) -> bool:
+        await page.wait_for_selector(step.target, state="hidden", timeout=10000)
+        return True
+
+    async def _screenshot(self, page: Page, step: TestStep) -> bool:
+        await page.screenshot(path=step.target or "screenshot.png")
+        return True
+
+    async def run_test(self, test: TestCase, screenshot_dir: str, page: Optional[Page] = None) -> TestResult:
+        """단일 테스트 케이스 실행 (page 생략 시 기본 페이지)"""
+        page = page or self.page
         start_time = datetime.now()
         steps_completed = 0
         error_message = None
@@ -214,32 +298,33 @@ class TestRunner:
 
         try:
             for i, step in enumerate(test.steps):
-                print(f"  [{i+1}/{len(test.steps)}] {step.action}: {step.description or step.target}")
+                # 동시 실행 시 다른 테스트 출력과 섞이므로 테스트 ID를 붙임
+                print(f"  {test.id} [{i+1}/{len(test.steps)}] {step.action}: {step.description or step.target}")
 
-                success = await self.run_step(step)
+                success = await self.run_step(step, page)
 
                 if not success:
                     error_message = f"Step {i+1} 실패: {step.action} - {step.target}"
                     # 실패 시 스크린샷
                     screenshot_path = f"{screenshot_dir}/{test.id}_failed.png"
-                    await self.page.screenshot(path=screenshot_path)
+                    await page.screenshot(path=screenshot_path)
                     break
 
                 steps_completed += 1
 
             status = TestStatus.PASSED if steps_completed == len(test.steps) else TestStatus.FAILED
 
-            # 성공 시에도 스크린샷 (선택적)
-            if status == TestStatus.PASSED:
-                screenshot_path = f"{screenshot_dir}/{test.id}_passed.png"
-                await self.page.screenshot(path=screenshot_path)
+            # 성공 시에도 스크린샷 (선택적, 인코딩이 빠른 JPEG)
+            if status == TestStatus.PASSED and self.capture_on_success:
+                screenshot_path = f"{screenshot_dir}/{test.id}_passed.jpg"
+                await page.screenshot(path=screenshot_path, type="jpeg", quality=60)
 
         except Exception as e:
             status = TestStatus.ERROR
             error_message = str(e)
             try:
                 screenshot_path = f"{screenshot_dir}/{test.id}_error.png"
-                await self.page.screenshot(path=screenshot_path)
+                await page.screenshot(path=screenshot_path)
             except:
                 pass
 
@@ -256,46 +341,68 @@ class TestRunner:
             total_steps=len(test.steps)
         )
 
-    async def run_all(self, tests: List[TestCase], project_name: str, site_url: str, screenshot_dir: str) -> TestReport:
-        """모든 테스트 실행"""
+    async def run_all(
+        self,
+        tests: List[TestCase],
+        project_name: str,
+        site_url: str,
+        screenshot_dir: str,
+        concurrency: int = 4
+    ) -> TestReport:
+        """모든 테스트 실행 (concurrency > 1이면 페이지 풀에서 페이지를 받아 동시 실행)"""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1 (got {concurrency})")
+
         Path(screenshot_dir).mkdir(parents=True, exist_ok=True)
 
         start_time = datetime.now()
-        results = []
 
         print(f"\n🧪 테스트 실행 시작: {project_name}")
         print(f"   사이트: {site_url}")
         print(f"   테스트 수: {len(tests)}")
+        print(f"   동시 실행: {concurrency}")
         print("=" * 50)
 
-        for i, test in enumerate(tests):
-            print(f"\n[{i+1}/{len(tests)}] {test.name} ({test.category})")
+        sem = asyncio.Semaphore(concurrency)
+        pool = _PagePool(self.context, concurrency)
+
+        async def run_one(i: int, test: TestCase) -> TestResult:
+            async with sem:
+                print(f"\n[{i+1}/{len(tests)}] {test.id} {test.name} ({test.category})")
 
-            result = await self.run_test(test, screenshot_dir)
-            results.append(result)
+                if concurrency == 1:
+                    result = await self.run_test(test, screenshot_dir)
+                else:
+                    page = await pool.acquire()
+                    try:
+                        result = await self.run_test(test, screenshot_dir, page)
+                    finally:
+                        await pool.release(page)
 
-            status_emoji = {
-                TestStatus.PASSED: "✅",
-                TestStatus.FAILED: "❌",
-                TestStatus.SKIPPED: "⏭️",
-                TestStatus.ERROR: "💥"
-            }
-            print(f"  → {status_emoji[result.status]} {result.status.value} ({result.duration_ms}ms)")
+            print(f"  → {test.id} {_STATUS_EMOJI[result.status]} {result.status.value} ({result.duration_ms}ms)")
 
             if result.error_message:
                 print(f"     {result.error_message}")
 
+            return result
+
+        try:
+            results = list(await asyncio.gather(*(run_one(i, test) for i, test in enumerate(tests))))
+        finally:
+            await pool.close()
+
         duration = (datetime.now() - start_time).total_seconds() * 1000
+        counts = Counter(r.status for r in results)
 
         report = TestReport(
             project_name=project_name,
             site_url=site_url,
             run_at=datetime.now().isoformat(),
             total_tests=len(tests),
-            passed=sum(1 for r in results if r.status == TestStatus.PASSED),
-            failed=sum(1 for r in results if r.status == TestStatus.FAILED),
-            skipped=sum(1 for r in results if r.status == TestStatus.SKIPPED),
-            error=sum(1 for r in results if r.status == TestStatus.ERROR),
+            passed=counts[TestStatus.PASSED],
+            failed=counts[TestStatus.FAILED],
+            skipped=counts[TestStatus.SKIPPED],
+            error=counts[TestStatus.ERROR],
             duration_ms=int(duration),
             results=results
         )
@@ -310,6 +417,11 @@ class TestRunner:
         return report
 
 
+def _is_table_separator(line: str) -> bool:
+    """마크다운 표 구분선 (|---|:---:| 등) 여부"""
+    return "-" in line and not line.strip("|-: ")
+
+
 def parse_scenario_to_tests(scenario_markdown: str, site_url: str) -> List[TestCase]:
     """
     마크다운 시나리오를 TestCase 리스트로 변환
@@ -321,25 +433,27 @@ def parse_scenario_to_tests(scenario_markdown: str, site_url: str) -> List[TestC
     """
     tests = []
 
-    # 테이블 행 파싱
-    lines = scenario_markdown.strip().split("\n")
+    lines = scenario_markdown.strip().splitlines()
 
     test_id = 0
-    for line in lines:
-        if not line.startswith("|") or "유형" in line or "---" in line:
+    for i, line in enumerate(lines):
+        # 구분선과 그 바로 위 헤더는 표 위치와 상관없이 건너뜀
+        if not line.startswith("|") or _is_table_separator(line):
+            continue
+        if i + 1 < len(lines) and _is_table_separator(lines[i + 1]):
             continue
 
-        parts = [p.strip() for p in line.split("|")[1:-1]]
-        if len(parts) < 3:
+        # 앞 세 칸만 필요하므로 나머지는 나누지 않음
+        parts = line.split("|", 4)
+        if len(parts) < 5 or not parts[2].strip():
             continue
 
-        category = parts[0].lower()
-        scenario_text = parts[1]
-        expected = parts[2]
+        category = parts[1].strip().lower()
+        scenario_text = parts[2].strip()
+        expected = parts[3].strip()
 
         # 단계 파싱 (1. xxx 2. xxx 형식)
-        step_pattern = r'(\d+)\.\s*([^0-9]+?)(?=\d+\.|$)'
-        step_matches = re.findall(step_pattern, scenario_text)
+        step_matches = _STEP_RE.findall(scenario_text)
 
         steps = []
 
@@ -370,65 +484,36 @@ def parse_scenario_to_tests(scenario_markdown: str, site_url: str) -> List[TestC
     return tests
 
 
-def text_to_step(text: str) -> Optional[TestStep]:
-    """자연어 텍스트를 TestStep으로 변환"""
-    text_lower = text.lower()
-
-    # 클릭
-    if "클릭" in text or "누르" in text or "선택" in text:
-        # 버튼/링크 이름 추출 시도
-        target = extract_target(text)
-        return TestStep(
-            action="click",
-            target=target or "button",
-            description=text
-        )
+# 자연어 키워드 → 액션 (앞에 있을수록 우선)
+_ACTION_KEYWORDS = (
+    ("click", ("클릭", "누르", "선택")),
+    ("fill", ("입력", "작성", "넣")),
+    ("assert_visible", ("확인", "검증", "체크")),
+    ("wait", ("기다", "대기", "로딩")),
+    ("navigate", ("이동", "접속", "열기")),
+    ("hover", ("호버", "마우스"))
+)
+_ACTION_RE = re.compile("|".join(f"(?P<{action}>{'|'.join(keywords)})" for action, keywords in _ACTION_KEYWORDS))
+_ACTION_PRIORITY = {action: i for i, (action, _) in enumerate(_ACTION_KEYWORDS)}
+
+_STEP_BUILDERS = {
+    "click": lambda text: TestStep(action="click", target=extract_target(text) or "button", description=text),
+    "fill": lambda text: TestStep(
+        action="fill", target=extract_target(text) or "input", value=extract_value(text) or "테스트 입력", description=text
+    ),
+    "assert_visible": lambda text: TestStep(action="assert_visible", target=extract_target(text) or "body", description=text),
+    "wait": lambda text: TestStep(action="wait", value="2000", description=text),
+    "navigate": lambda text: TestStep(action="navigate", target=extract_url(text) or "/", description=text),
+    "hover": lambda text: TestStep(action="hover", target=extract_target(text) or "button", description=text)
+}
 
-    # 입력
-    if "입력" in text or "작성" in text or "넣" in text:
-        target = extract_target(text)
-        value = extract_value(text)
-        return TestStep(
-            action="fill",
-            target=target or "input",
-            value=value or "테스트 입력",
-            description=text
-        )
 
-    # 확인/검증
-    if "확인" in text or "검증" in text or "체크" in text:
-        target = extract_target(text)
-        return TestStep(
-            action="assert_visible",
-            target=target or "body",
-            description=text
-        )
-
-    # 대기
-    if "기다" in text or "대기" in text or "로딩" in text:
-        return TestStep(
-            action="wait",
-            value="2000",
-            description=text
-        )
-
-    # 이동/네비게이션
-    if "이동" in text or "접속" in text or "열기" in text:
-        target = extract_url(text)
-        return TestStep(
-            action="navigate",
-            target=target or "/",
-            description=text
-        )
-
-    # 호버
-    if "호버" in text or "마우스" in text:
-        target = extract_target(text)
-        return TestStep(
-            action="hover",
-            target=target or "button",
-            description=text
-        )
+def text_to_step(text: str) -> Optional[TestStep]:
+    """자연어 텍스트를 TestStep으로 변환"""
+    # 키워드를 한 번에 찾고, 여러 액션이 걸리면 우선순위가 높은 쪽
+    actions = {m.lastgroup for m in _ACTION_RE.finditer(text)}
+    if actions:
+        return _STEP_BUILDERS[min(actions, key=_ACTION_PRIORITY.__getitem__)](text)
 
     # 기본: 대기
     return TestStep(
@@ -441,12 +526,12 @@ def text_to_step(text: str) -> Optional[TestStep]:
 def extract_target(text: str) -> Optional[str]:
     """텍스트에서 선택자 추출 시도"""
     # 따옴표 안의 텍스트
-    quoted = re.search(r'["\']([^"\']+)["\']', text)
+    quoted = _QUOTED_RE.search(text)
     if quoted:
         return f"text={quoted.group(1)}"
 
     # 버튼 이름 패턴
-    button_match = re.search(r'([\w가-힣]+)\s*(버튼|링크|탭|메뉴)', text)
+    button_match = _BUTTON_RE.search(text)
     if button_match:
         return f"text={button_match.group(1)}"
 
@@ -455,7 +540,7 @@ def extract_target(text: str) -> Optional[str]:
 
 def extract_value(text: str) -> Optional[str]:
     """텍스트에서 입력값 추출"""
-    quoted = re.search(r'["\']([^"\']+)["\']', text)
+    quoted = _QUOTED_RE.search(text)
     if quoted:
         return quoted.group(1)
     return None
@@ -463,7 +548,7 @@ def extract_value(text: str) -> Optional[str]:
 
 def extract_url(text: str) -> Optional[str]:
     """텍스트에서 URL 추출"""
-    url_match = re.search(r'https?://[^\s]+', text)
+    url_match = _URL_RE.search(text)
     if url_match:
         return url_match.group()
     return None
@@ -473,7 +558,7 @@ def generate_report_markdown(report: TestReport) -> str:
     """테스트 리포트를 마크다운으로 변환"""
     pass_rate = (report.passed / report.total_tests * 100) if report.total_tests > 0 else 0
 
-    md = f"""# 🧪 QA 테스트 리포트
+    parts = [f"""# 🧪 QA 테스트 리포트
 
 **프로젝트:** {report.project_name}
 **사이트:** {report.site_url}
@@ -498,30 +583,26 @@ def generate_report_markdown(report: TestReport) -> str:
 
 | ID | 테스트 | 상태 | 소요시간 | 진행 |
 |----|--------|------|---------|------|
-"""
+"""]
 
+    failed_tests = []  # 실패/에러 테스트 (표를 만들면서 함께 수집)
     for r in report.results:
-        status_emoji = {
-            TestStatus.PASSED: "✅",
-            TestStatus.FAILED: "❌",
-            TestStatus.SKIPPED: "⏭️",
-            TestStatus.ERROR: "💥"
-        }
-        md += f"| {r.test_id} | {r.test_name[:30]} | {status_emoji[r.status]} | {r.duration_ms}ms | {r.steps_completed}/{r.total_steps} |\n"
+        parts.append(f"| {r.test_id} | {r.test_name[:30]} | {_STATUS_EMOJI[r.status]} | {r.duration_ms}ms | {r.steps_completed}/{r.total_steps} |\n")
+        if r.status in (TestStatus.FAILED, TestStatus.ERROR):
+            failed_tests.append(r)
 
     # 실패한 테스트 상세
-    failed_tests = [r for r in report.results if r.status in [TestStatus.FAILED, TestStatus.ERROR]]
     if failed_tests:
-        md += "\n---\n\n## ❌ 실패 상세\n\n"
+        parts.append("\n---\n\n## ❌ 실패 상세\n\n")
         for r in failed_tests:
-            md += f"### {r.test_id}: {r.test_name}\n\n"
-            md += f"- **상태:** {r.status.value}\n"
-            md += f"- **에러:** {r.error_message}\n"
+            parts.append(f"### {r.test_id}: {r.test_name}\n\n")
+            parts.append(f"- **상태:** {r.status.value}\n")
+            parts.append(f"- **에러:** {r.error_message}\n")
             if r.screenshot_path:
-                md += f"- **스크린샷:** {r.screenshot_path}\n"
-            md += "\n"
+                parts.append(f"- **스크린샷:** {r.screenshot_path}\n")
+            parts.append("\n")
 
-    return md
+    return "".join(parts)
 
 
 async def run_tests(
@@ -530,7 +611,9 @@ async def run_tests(
     scenarios: str,
     output_dir: str = "./qa-test-results",
     auth_site: Optional[str] = None,
-    headless: bool = True
+    headless: bool = True,
+    concurrency: int = 4,
+    capture_on_success: bool = False
 ) -> TestReport:
     """
     테스트 실행 메인 함수
@@ -542,6 +625,8 @@ async def run_tests(
         output_dir: 결과 저장 경로
         auth_site: 인증 사이트 이름 (쿠키 사용)
         headless: 헤드리스 모드
+        concurrency: 동시에 실행할 테스트 수 (1이면 순차 실행)
+        capture_on_success: 성공한 테스트도 스크린샷 저장
     """
     # 시나리오 파싱
     tests = parse_scenario_to_tests(scenarios, site_url)
@@ -555,16 +640,18 @@ async def run_tests(
         )
 
     # 테스트 실행
-    async with TestRunner(headless=headless, auth_site=auth_site) as runner:
-        report = await runner.run_all(tests, project_name, site_url, output_dir)
+    async with TestRunner(headless=headless, auth_site=auth_site, capture_on_success=capture_on_success) as runner:
+        report = await runner.run_all(tests, project_name, site_url, output_dir, concurrency)
 
     # 리포트 저장
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     # JSON 저장
-    report_dict = asdict(report)
+    # 모든 필드가 평범한 값이라 asdict의 재귀 복사 없이 필드를 한 번씩만 읽어 변환
+    report_dict = {f.name: getattr(report, f.name) for f in fields(TestReport) if f.name != "results"}
+    result_names = [f.name for f in fields(TestResult)]
     report_dict["results"] = [
-        {**asdict(r), "status": r.status.value}
+        {**{name: getattr(r, name) for name in result_names}, "status": r.status.value}
         for r in report.results
     ]
     with open(f"{output_dir}/report.json", "w", encoding="utf-8") as f:
@@ -586,10 +673,12 @@ def run_tests_sync(
     scenarios: str,
     output_dir: str = "./qa-test-results",
     auth_site: Optional[str] = None,
-    headless: bool = True
+    headless: bool = True,
+    concurrency: int = 4,
+    capture_on_success: bool = False
 ) -> TestReport:
     """동기 버전"""
-    return asyncio.run(run_tests(project_name, site_url, scenarios, output_dir, auth_site, headless))
+    return asyncio.run(run_tests(project_name, site_url, scenarios, output_dir, auth_site, headless, concurrency, capture_on_success))
 
 
 # CLI 인터페이스
@@ -603,9 +692,14 @@ if __name__ == "__main__":
     parser.add_argument("--output", "-o", default="./qa-test-results", help="결과 저장 경로")
     parser.add_argument("--auth", "-a", help="인증 사이트 이름")
     parser.add_argument("--headed", action="store_true", help="브라우저 표시 (디버깅용)")
+    parser.add_argument("--concurrency", "-c", type=int, default=4, help="동시 실행 테스트 수 (기본: 4, 1이면 순차)")
+    parser.add_argument("--capture-success", action="store_true", help="성공한 테스트도 스크린샷 저장")
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+
     # 시나리오 로드
     if args.scenario_file:
         with open(args.scenario_file, "r", encoding="utf-8") as f:
@@ -626,7 +720,9 @@ if __name__ == "__main__":
         scenarios=scenarios,
         output_dir=args.output,
         auth_site=args.auth,
-        headless=not args.headed
+        headless=not args.headed,
+        concurrency=args.concurrency,
+        capture_on_success=args.capture_success
     )
 
     # 종료 코드